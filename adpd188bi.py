@@ -0,0 +1,333 @@
+"""ADPD188BI smoke-detection optical front end (MikroE Smoke 2 Click) over I2C.
+
+Register addresses are 8-bit and every register holds a 16-bit word, sent
+high byte first. Multiword reads auto-increment the address, except reads of
+FIFO_ACCESS (0x60), which pop successive FIFO words instead. Register writes
+are single-word only.
+
+The driver runs the part in FIFO mode: each sample period the enabled time
+slots append a packet to the 128-byte FIFO, GPIO0 can signal once
+``fifo_threshold`` packets are queued, and ``drain()`` pops every queued
+packet with one combined write/read ``i2c_rdwr`` transfer.
+"""
+
+import time
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+from smbus2 import SMBus, i2c_msg
+
+
+DEFAULT_ADDRESS = 0x64
+
+REG_STATUS = 0x00          # [15:8] FIFO_SAMPLES (bytes), [6] SLOTB_INT, [5] SLOTA_INT
+REG_INT_MASK = 0x01        # [8] FIFO_INT_MASK, [6] SLOTB_INT_MASK, [5] SLOTA_INT_MASK
+REG_GPIO_DRV = 0x02        # [2] GPIO0_ENA, [1] GPIO0_DRV, [0] GPIO0_POL
+REG_FIFO_THRESH = 0x06     # [13:8] threshold in words; interrupt when exceeded
+REG_DEVID = 0x08
+REG_GPIO_CTRL = 0x0B       # [4:0] GPIO0_ALT_CFG
+REG_SW_RESET = 0x0F
+REG_MODE = 0x10
+REG_SLOT_EN = 0x11
+REG_FSAMPLE = 0x12
+REG_PD_LED_SELECT = 0x14
+REG_SAMPLE_CLK = 0x4B      # [7] CLK32K_EN
+REG_DATA_ACCESS_CTL = 0x5F
+REG_FIFO_ACCESS = 0x60
+REG_SLOTA_DATA = 0x64      # 0x64-0x67: Slot A channels 1-4, 16 bit
+REG_SLOTB_DATA = 0x68      # 0x68-0x6B: Slot B channels 1-4, 16 bit
+
+MODE_STANDBY = 0x0
+MODE_PROGRAM = 0x1
+MODE_NORMAL = 0x2
+
+DEV_ID = 0x16
+FIFO_SIZE_BYTES = 128
+STATUS_CLEAR_INTERRUPTS = 0x00FF
+STATUS_CLEAR_FIFO = 0x8000
+INT_MASK_FIFO_ONLY = 0x00FF    # FIFO interrupt on, per-slot sample interrupts masked
+GPIO0_ENABLE = 0x0004          # Always driven, active high
+GPIO0_ALT_INTERRUPT = 0x0001
+SAMPLE_CLK_DEFAULT = 0x2612
+CLK32K_EN = 0x0080
+SAMPLE_CLOCK_HZ = 32768
+MAX_MESSAGES = 42  # I2C_RDWR_IOCTL_MAX_MSGS in the Linux i2c-dev driver
+
+# Words per packet for each SLOTx_FIFO_MODE value.
+FIFO_MODE_WORDS = {0: 0, 1: 1, 2: 2, 4: 4, 6: 8}
+
+# Datasheet Table 26, recommended configuration for smoke detection: Slot A
+# blue LED, Slot B IR LED, both writing a 32-bit sum of their photodiodes to
+# the FIFO at 16 Hz.
+SMOKE_CONFIG: Sequence[Tuple[int, int]] = (
+    (0x11, 0x30A9),
+    (0x12, 0x0200),
+    (0x14, 0x011D),
+    (0x15, 0x0000),
+    (0x17, 0x0009),
+    (0x18, 0x0000),
+    (0x19, 0x3FFF),
+    (0x1A, 0x3FFF),
+    (0x1B, 0x3FFF),
+    (0x1D, 0x0009),
+    (0x1E, 0x0000),
+    (0x1F, 0x3FFF),
+    (0x20, 0x3FFF),
+    (0x21, 0x3FFF),
+    (0x22, 0x3539),
+    (0x23, 0x3536),
+    (0x24, 0x1530),
+    (0x25, 0x630C),
+    (0x30, 0x0320),
+    (0x31, 0x040E),
+    (0x35, 0x0320),
+    (0x36, 0x040E),
+    (0x39, 0x22F0),
+    (0x3B, 0x22F0),
+    (0x3C, 0x31C6),
+    (0x42, 0x1C34),
+    (0x43, 0xADA5),
+    (0x44, 0x1C34),
+    (0x45, 0xADA5),
+    (0x54, 0x0AA0),
+    (0x58, 0x0544),
+)
+
+# Registers read back after configuring, and compared to decide whether a
+# running part can be reused: slot setup, sample rate and the FIFO interrupt.
+VERIFY_REGS = (REG_SLOT_EN, REG_FSAMPLE, REG_PD_LED_SELECT, REG_FIFO_THRESH, REG_INT_MASK)
+
+
+@dataclass(frozen=True)
+class Sample:
+    # One value per photodiode channel, or a single value for the summed modes.
+    slot_a: Tuple[int, ...]
+    slot_b: Tuple[int, ...]
+
+
+def _words(data: bytes) -> List[int]:
+    return [(data[i] << 8) | data[i + 1] for i in range(0, len(data) - 1, 2)]
+
+
+def _slot_modes(slot_en: int) -> Tuple[int, int]:
+    slot_a = (slot_en >> 2) & 0x7 if slot_en & 0x01 else 0
+    slot_b = (slot_en >> 6) & 0x7 if slot_en & 0x20 else 0
+    return slot_a, slot_b
+
+
+def _packet_words(slot_a_mode: int, slot_b_mode: int) -> int:
+    return FIFO_MODE_WORDS.get(slot_a_mode, 0) + FIFO_MODE_WORDS.get(slot_b_mode, 0)
+
+
+def _decode_slot(words: Sequence[int], mode: int) -> Tuple[int, ...]:
+    if mode in (2, 6):
+        # 32-bit values arrive as bits [15:0] then [31:16].
+        return tuple(words[i] | (words[i + 1] << 16) for i in range(0, len(words), 2))
+    return tuple(words)
+
+
+class ADPD188BI:
+    def __init__(self, bus: SMBus, address: int = DEFAULT_ADDRESS) -> None:
+        self.bus = bus
+        self.address = address
+        self.slot_a_mode = 0
+        self.slot_b_mode = 0
+
+    def write(self, reg: int, value: int) -> None:
+        self.bus.i2c_rdwr(i2c_msg.write(self.address, [reg, value >> 8, value & 0xFF]))
+
+    def read(self, reg: int) -> int:
+        return self.read_words(reg, 1)[0]
+
+    def read_words(self, reg: int, count: int) -> List[int]:
+        """Read ``count`` words from consecutive registers in one transfer."""
+        return _words(self.read_bytes(reg, count * 2))
+
+    def read_bytes(self, reg: int, length: int) -> bytes:
+        write = i2c_msg.write(self.address, [reg])
+        read = i2c_msg.read(self.address, length)
+        self.bus.i2c_rdwr(write, read)
+        return bytes(read)
+
+    def reset(self) -> None:
+        """Software reset; the part comes back in standby with default registers."""
+        self.write(REG_SW_RESET, 0x0001)
+
+    def set_mode(self, mode: int) -> None:
+        self.write(REG_MODE, mode)
+
+    def device_id(self) -> int:
+        return self.read(REG_DEVID) & 0xFF
+
+    def init_table(
+        self,
+        config: Sequence[Tuple[int, int]] = SMOKE_CONFIG,
+        sample_hz: Optional[float] = None,
+        fifo_threshold: int = 1,
+        interrupt: bool = True,
+    ) -> List[Tuple[int, int]]:
+        """Register writes that take the part from reset to configured in program mode.
+
+        ``config`` is a list of (register, value) writes and must set SLOT_EN
+        (0x11). ``fifo_threshold`` is the number of whole packets to queue before
+        the FIFO interrupt asserts; with ``interrupt`` GPIO0 carries it.
+        """
+        table = [(REG_SAMPLE_CLK, SAMPLE_CLK_DEFAULT | CLK32K_EN), (REG_MODE, MODE_PROGRAM)]
+        table += config
+        if sample_hz is not None:
+            table.append((REG_FSAMPLE, max(1, round(SAMPLE_CLOCK_HZ / 4 / sample_hz))))
+
+        slot_en = dict(config)[REG_SLOT_EN]
+        packet_words = _packet_words(*_slot_modes(slot_en))
+        # Threshold is in words and fires when exceeded, hence the -1.
+        threshold = min(packet_words * fifo_threshold, FIFO_SIZE_BYTES // 2) - 1
+        table.append((REG_FIFO_THRESH, max(threshold, 0) << 8))
+        table.append((REG_INT_MASK, INT_MASK_FIFO_ONLY))
+        if interrupt:
+            table.append((REG_GPIO_DRV, GPIO0_ENABLE))
+            table.append((REG_GPIO_CTRL, GPIO0_ALT_INTERRUPT))
+        table.append((REG_STATUS, STATUS_CLEAR_FIFO | STATUS_CLEAR_INTERRUPTS))
+        return table
+
+    def write_table(self, table: Sequence[Tuple[int, int]]) -> None:
+        """Apply (register, value) writes in order, as few ``i2c_rdwr`` calls as possible.
+
+        Writes are single-word only, so each one is its own message; the
+        messages go out back to back in one ioctl per ``MAX_MESSAGES``.
+        """
+        msgs = [i2c_msg.write(self.address, [reg, value >> 8, value & 0xFF]) for reg, value in table]
+        for i in range(0, len(msgs), MAX_MESSAGES):
+            self.bus.i2c_rdwr(*msgs[i:i + MAX_MESSAGES])
+        for reg, value in table:
+            if reg == REG_SLOT_EN:
+                self.slot_a_mode, self.slot_b_mode = _slot_modes(value)
+
+    def read_registers(self, regs: Sequence[int]) -> List[int]:
+        """Read scattered registers, one word each, in a single ``i2c_rdwr`` call."""
+        msgs = []
+        for reg in regs:
+            msgs += [i2c_msg.write(self.address, [reg]), i2c_msg.read(self.address, 2)]
+        self.bus.i2c_rdwr(*msgs)
+        return [_words(bytes(read))[0] for read in msgs[1::2]]
+
+    def verify(self, table: Sequence[Tuple[int, int]], regs: Sequence[int] = VERIFY_REGS) -> bool:
+        """True if each register in ``regs`` holds its last value in ``table``."""
+        expected = {reg: value for reg, value in table if reg in regs}
+        if not expected:
+            return True
+        actual = self.read_registers(list(expected))
+        return actual == list(expected.values())
+
+    def configure(
+        self,
+        config: Sequence[Tuple[int, int]] = SMOKE_CONFIG,
+        sample_hz: Optional[float] = None,
+        fifo_threshold: int = 1,
+        interrupt: bool = True,
+    ) -> None:
+        """Reset and program the part for FIFO sampling, leaving it in program mode.
+
+        Arguments as for init_table(). Raises RuntimeError if the key registers
+        do not read back as written.
+        """
+        table = self.init_table(config, sample_hz, fifo_threshold, interrupt)
+        self.reset()
+        self.write_table(table)
+        if not self.verify(table):
+            raise RuntimeError("ADPD188BI configuration did not read back as written")
+
+    def resume(
+        self,
+        config: Sequence[Tuple[int, int]] = SMOKE_CONFIG,
+        sample_hz: Optional[float] = None,
+        fifo_threshold: int = 1,
+        interrupt: bool = True,
+    ) -> bool:
+        """Start sampling, reusing the configuration if the part is already running it.
+
+        After a process or watchdog restart the sensor keeps sampling with its
+        registers intact, so when it is in normal mode and the key registers
+        match, only the FIFO is cleared. Otherwise it is configured from reset.
+        Returns True if the running configuration was reused.
+        """
+        table = self.init_table(config, sample_hz, fifo_threshold, interrupt)
+        expected = {reg: value for reg, value in table if reg in VERIFY_REGS}
+        regs = [REG_MODE] + list(expected)
+        mode, *actual = self.read_registers(regs)
+        if mode & 0x3 == MODE_NORMAL and actual == list(expected.values()):
+            self.slot_a_mode, self.slot_b_mode = _slot_modes(dict(table)[REG_SLOT_EN])
+            self.write_table([
+                (REG_MODE, MODE_PROGRAM),
+                (REG_STATUS, STATUS_CLEAR_FIFO | STATUS_CLEAR_INTERRUPTS),
+                (REG_MODE, MODE_NORMAL),
+            ])
+            return True
+        self.configure(config, sample_hz, fifo_threshold, interrupt)
+        self.start()
+        return False
+
+    @property
+    def packet_words(self) -> int:
+        return _packet_words(self.slot_a_mode, self.slot_b_mode)
+
+    def start(self) -> None:
+        self.set_mode(MODE_NORMAL)
+
+    def stop(self) -> None:
+        """Back to standby, clearing the FIFO and any pending interrupts."""
+        self.set_mode(MODE_PROGRAM)
+        self.write(REG_STATUS, STATUS_CLEAR_FIFO | STATUS_CLEAR_INTERRUPTS)
+        self.set_mode(MODE_STANDBY)
+
+    def fifo_bytes(self) -> int:
+        return self.read(REG_STATUS) >> 8
+
+    def data_ready(self) -> bool:
+        """True once at least one whole packet is queued."""
+        return self.packet_words > 0 and self.fifo_bytes() >= self.packet_words * 2
+
+    def drain(self, fifo_bytes: Optional[int] = None) -> List[Sample]:
+        """Pop every whole packet queued in the FIFO with a single burst read.
+
+        Pass ``fifo_bytes`` if the FIFO count was just read, to skip reading it again.
+        """
+        packet_bytes = self.packet_words * 2
+        if packet_bytes == 0:
+            return []
+        if fifo_bytes is None:
+            fifo_bytes = self.fifo_bytes()
+        length = (fifo_bytes // packet_bytes) * packet_bytes
+        if length == 0:
+            return []
+
+        words = _words(self.read_bytes(REG_FIFO_ACCESS, length))
+        a_words = FIFO_MODE_WORDS.get(self.slot_a_mode, 0)
+        samples = []
+        for i in range(0, len(words), self.packet_words):
+            packet = words[i:i + self.packet_words]
+            samples.append(Sample(
+                _decode_slot(packet[:a_words], self.slot_a_mode),
+                _decode_slot(packet[a_words:], self.slot_b_mode),
+            ))
+        return samples
+
+    def read_latest(self) -> Sample:
+        """Latest 16-bit value of all eight channels, both slots in one transfer.
+
+        Data hold keeps a sample landing mid-read from tearing the values.
+        """
+        self.write(REG_DATA_ACCESS_CTL, 0x0006)
+        try:
+            words = self.read_words(REG_SLOTA_DATA, 8)
+        finally:
+            self.write(REG_DATA_ACCESS_CTL, 0x0000)
+        return Sample(tuple(words[:4]), tuple(words[4:]))
+
+    def wait_for_data(self, timeout_s: float, poll_s: float = 0.01) -> bool:
+        """Poll the FIFO count until a packet is queued or ``timeout_s`` passes."""
+        deadline = time.monotonic() + timeout_s
+        while not self.data_ready():
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(poll_s)
+        return True
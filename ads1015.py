@@ -0,0 +1,169 @@
+"""TI ADS1015 12-bit ADC (MikroE AQI5 Click) over I2C.
+
+Conversions are timed from the configured data rate instead of fixed
+sleeps: single-shot reads wait for the ALERT/RDY pin when one is wired, or
+sleep one conversion time and then check the OS bit. Continuous mode
+reads back-to-back conversions of one input for oversampling, and the
+pointer register is left on the conversion register between reads so each
+sample is a single two-byte read.
+
+Values are the signed 16-bit conversion register, as read_ads1015 in
+firemark-reporter.py returned them; the 12-bit result sits in bits 15:4.
+"""
+
+import time
+from typing import Dict, List, Optional, Sequence
+
+from smbus2 import SMBus, i2c_msg
+
+from firemark_drdy import DataReady
+
+
+DEFAULT_ADDRESS = 0x48
+
+REG_CONVERSION = 0x00
+REG_CONFIG = 0x01
+REG_LO_THRESH = 0x02
+REG_HI_THRESH = 0x03
+
+CONFIG_OS = 0x8000             # Write: start a single conversion; read: 1 when idle
+CONFIG_MODE_SINGLE = 0x0100
+CONFIG_COMP_QUE_DISABLE = 0x0003
+CONFIG_COMP_QUE_ONE = 0x0000   # ALERT/RDY asserts after every conversion
+
+# MUX[14:12] for AINx against GND.
+SINGLE_ENDED_MUX = {0: 0x4000, 1: 0x5000, 2: 0x6000, 3: 0x7000}
+
+# PGA[11:9] by full-scale range in volts.
+GAINS = {6.144: 0x0000, 4.096: 0x0200, 2.048: 0x0400, 1.024: 0x0600, 0.512: 0x0800, 0.256: 0x0A00}
+
+# DR[7:5] by samples per second.
+DATA_RATES = {128: 0x0000, 250: 0x0020, 490: 0x0040, 920: 0x0060, 1600: 0x0080, 2400: 0x00A0, 3300: 0x00C0}
+
+# The internal oscillator is within 10%, and the part wakes from power-down
+# before a single-shot conversion.
+RATE_TOLERANCE = 1.1
+WAKE_S = 0.000025
+# Give up waiting after this many conversion times.
+TIMEOUT_CONVERSIONS = 10
+
+
+def _signed(data: bytes) -> int:
+    value = (data[0] << 8) | data[1]
+    return value - (1 << 16) if value & 0x8000 else value
+
+
+class ADS1015:
+    def __init__(
+        self,
+        bus: SMBus,
+        address: int = DEFAULT_ADDRESS,
+        data_rate: int = 1600,
+        full_scale: float = 6.144,
+        ready: Optional[DataReady] = None,
+    ) -> None:
+        """``ready`` is the ALERT/RDY line (active low) from firemark_drdy, if wired.
+
+        A polling source is ignored, since the OS bit already gives the same answer.
+        """
+        if data_rate not in DATA_RATES:
+            raise ValueError(f"data rate must be one of {sorted(DATA_RATES)}")
+        if full_scale not in GAINS:
+            raise ValueError(f"full scale must be one of {sorted(GAINS)}")
+        self.bus = bus
+        self.address = address
+        self.data_rate = data_rate
+        self.full_scale = full_scale
+        self.ready = ready if ready is not None and ready.interrupt else None
+        self.conversion_s = RATE_TOLERANCE / data_rate + WAKE_S
+        self._pointer: Optional[int] = None
+        self._continuous: Optional[int] = None
+        if self.ready is not None:
+            # Hi_thresh MSB 1 and Lo_thresh MSB 0 turn ALERT/RDY into a conversion-ready output.
+            self._write(REG_HI_THRESH, 0x8000)
+            self._write(REG_LO_THRESH, 0x0000)
+
+    def _write(self, reg: int, value: int) -> None:
+        self.bus.i2c_rdwr(i2c_msg.write(self.address, [reg, value >> 8, value & 0xFF]))
+        self._pointer = reg
+
+    def _read(self, reg: int) -> bytes:
+        read = i2c_msg.read(self.address, 2)
+        if self._pointer == reg:
+            self.bus.i2c_rdwr(read)
+        else:
+            self.bus.i2c_rdwr(i2c_msg.write(self.address, [reg]), read)
+            self._pointer = reg
+        return bytes(read)
+
+    def _config(self, channel: int, single_shot: bool) -> int:
+        config = SINGLE_ENDED_MUX[channel] | GAINS[self.full_scale] | DATA_RATES[self.data_rate]
+        if single_shot:
+            config |= CONFIG_OS | CONFIG_MODE_SINGLE
+        config |= CONFIG_COMP_QUE_ONE if self.ready is not None else CONFIG_COMP_QUE_DISABLE
+        return config
+
+    def volts(self, raw: float) -> float:
+        return raw * self.full_scale / 32768
+
+    def busy(self) -> bool:
+        """True while a single-shot conversion is in progress (OS bit clear)."""
+        return not self._read(REG_CONFIG)[0] & (CONFIG_OS >> 8)
+
+    def _wait_single(self) -> None:
+        timeout = self.conversion_s * TIMEOUT_CONVERSIONS
+        if self.ready is not None:
+            if not self.ready.wait(timeout):
+                raise TimeoutError("ADS1015 ALERT/RDY did not assert")
+            return
+        time.sleep(self.conversion_s)
+        deadline = time.monotonic() + timeout
+        while self.busy():
+            if time.monotonic() >= deadline:
+                raise TimeoutError("ADS1015 conversion did not finish")
+            time.sleep(self.conversion_s / 4)
+
+    def read_single(self, channel: int) -> int:
+        """One single-shot conversion of AIN``channel`` against GND."""
+        self._continuous = None
+        self._write(REG_CONFIG, self._config(channel, single_shot=True))
+        self._wait_single()
+        return _signed(self._read(REG_CONVERSION))
+
+    def scan(self, channels: Sequence[int]) -> List[int]:
+        """Single-shot conversions of each channel in turn."""
+        return [self.read_single(channel) for channel in channels]
+
+    def start_continuous(self, channel: int) -> None:
+        """Convert AIN``channel`` continuously; a no-op if it already is."""
+        if self._continuous == channel:
+            return
+        self._write(REG_CONFIG, self._config(channel, single_shot=False))
+        self._continuous = channel
+        # The conversion register holds the previous input until the first new
+        # result. ALERT/RDY may still be asserted from a single-shot read, so time it.
+        time.sleep(self.conversion_s)
+
+    def _wait_next(self) -> None:
+        if self.ready is None or not self.ready.wait(self.conversion_s * TIMEOUT_CONVERSIONS):
+            time.sleep(self.conversion_s)
+
+    def read_average(self, channel: int, samples: int) -> float:
+        """Mean of ``samples`` consecutive continuous-mode conversions of AIN``channel``."""
+        self.start_continuous(channel)
+        total = 0
+        for i in range(samples):
+            if i:
+                self._wait_next()
+            total += _signed(self._read(REG_CONVERSION))
+        return total / samples
+
+    def scan_average(self, channels: Dict[str, int], samples: int) -> Dict[str, float]:
+        """Oversampled reading of each named channel, one continuous run per channel."""
+        return {name: self.read_average(channel, samples) for name, channel in channels.items()}
+
+    def stop(self) -> None:
+        """Leave continuous mode; the ADC powers down between single-shot conversions."""
+        config = self._config(0, single_shot=True) & ~CONFIG_OS
+        self._write(REG_CONFIG, config)
+        self._continuous = None
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""Throughput benchmark for qwiic_alphanumeric on the in-memory HT16K33 bus.
+
+Runs without hardware. For each scenario it reports prints per second,
+update latency, and I2C transactions, bytes and wire time per frame.
+"""
+
+import argparse
+import random
+import statistics
+import string
+import time
+
+import qwiic_alphanumeric
+from qwiic_alphanumeric_mock import MockI2CBus
+
+MUX_ADDRESS = 0x77
+ADDRESSES = (0x70, 0x71, 0x72, 0x73)
+TEXT_CHARS = string.ascii_uppercase + string.digits + "  .:"
+
+
+def random_text(rng, length):
+    return "".join(rng.choice(TEXT_CHARS) for _ in range(length))
+
+
+def counter_frames(rng, frames):
+    return [f"{i % 10000:04d}" for i in range(frames)]
+
+
+def scenario_single(args, rng):
+    bus = MockI2CBus(ADDRESSES[:1], clock_hz=args.clock)
+    display = qwiic_alphanumeric.QwiicAlphanumeric(i2c_driver=bus)
+    display.begin(ADDRESSES[0])
+    return display, [bus], counter_frames(rng, args.frames)
+
+
+def scenario_quad(args, rng):
+    bus = MockI2CBus(ADDRESSES, clock_hz=args.clock)
+    display = qwiic_alphanumeric.QwiicAlphanumeric(i2c_driver=bus)
+    display.begin(*ADDRESSES)
+    return display, [bus], [random_text(rng, 16) for _ in range(args.frames)]
+
+
+def scenario_quad_scroll(args, rng):
+    bus = MockI2CBus(ADDRESSES, clock_hz=args.clock)
+    display = qwiic_alphanumeric.QwiicAlphanumeric(i2c_driver=bus)
+    display.begin(*ADDRESSES)
+    frames = display.render_scroll(random_text(rng, 48))
+    return display, [bus], (frames * (args.frames // len(frames) + 1))[:args.frames]
+
+
+def scenario_wall(args, rng):
+    # 16 displays: two buses, each with a mux carrying two channels of four displays.
+    buses = []
+    entries = []
+    for channels in ((0, 1), (2, 3)):
+        bus = MockI2CBus([(ch, a) for ch in channels for a in ADDRESSES], mux_address=MUX_ADDRESS,
+                         clock_hz=args.clock, simulate_time=args.simulate_time)
+        buses.append(bus)
+        entries += [(bus, ch, a) for ch in channels for a in ADDRESSES]
+    display = qwiic_alphanumeric.QwiicAlphanumericGroup(entries, mux_address=MUX_ADDRESS)
+    display.begin()
+    return display, buses, [random_text(rng, 64) for _ in range(args.frames)]
+
+
+SCENARIOS = {
+    "single": ("1 display, 4-digit counter", scenario_single),
+    "quad": ("4 displays, random text", scenario_quad),
+    "scroll": ("4 displays, precomputed scroll frames", scenario_quad_scroll),
+    "wall": ("16 displays, 2 buses x 2 mux channels", scenario_wall),
+}
+
+
+def run(name, args):
+    title, setup = SCENARIOS[name]
+    display, buses, frames = setup(args, random.Random(args.seed))
+    display.populated_rows_only = args.populated_rows
+    for bus in buses:
+        bus.reset_counters()
+
+    latencies = []
+    started = time.perf_counter()
+    for frame in frames:
+        t = time.perf_counter()
+        if isinstance(frame, str):
+            display.print(frame)
+        else:
+            display.display_RAM[0:len(frame)] = frame
+            display.update_display()
+        latencies.append(time.perf_counter() - t)
+    elapsed = time.perf_counter() - started
+    if isinstance(display, qwiic_alphanumeric.QwiicAlphanumericGroup):
+        display.close()
+
+    n = len(frames)
+    transactions = sum(bus.transactions for bus in buses)
+    sent = sum(bus.bytes for bus in buses)
+    # Buses run side by side, so a frame takes as long as the busiest bus.
+    wire_s = max(bus.wire_time_s for bus in buses)
+    latencies.sort()
+    print(f"{name:<8} {title}")
+    print(f"  {n / elapsed:>10.0f} prints/s   latency p50 {latencies[n // 2] * 1e6:>7.1f} us"
+          f"  p99 {latencies[int(n * 0.99)] * 1e6:>7.1f} us  mean {statistics.mean(latencies) * 1e6:>7.1f} us")
+    print(f"  {transactions / n:>10.2f} transactions/frame  {sent / n:>6.1f} bytes/frame"
+          f"  {wire_s / n * 1e3:>6.3f} ms/frame on the wire at {args.clock // 1000} kHz")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Benchmark qwiic_alphanumeric against an in-memory HT16K33 bus.",
+    )
+    parser.add_argument("scenarios", nargs="*", metavar="scenario",
+                        help=f"any of {', '.join(SCENARIOS)} (default: all)")
+    parser.add_argument("--frames", type=int, default=2000)
+    parser.add_argument("--clock", type=int, default=400000, help="I2C clock in Hz for wire time")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--populated-rows", action="store_true",
+                        help="write only the RAM bytes the 14-segment layout uses")
+    parser.add_argument("--simulate-time", action="store_true",
+                        help="sleep for wire time on the multi-bus scenario, to see buses overlap")
+    args = parser.parse_args()
+    for name in args.scenarios:
+        if name not in SCENARIOS:
+            parser.error(f"unknown scenario {name!r}")
+    args.scenarios = args.scenarios or list(SCENARIOS)
+    return args
+
+
+def main() -> None:
+    args = parse_args()
+    for name in args.scenarios:
+        run(name, args)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,13 +2,13 @@
 """Combined Firemark sensor reporter and health checker."""
 
 import time
-import requests
+import importlib.util
 import board
 import busio
 import socket
 import json
-import subprocess
 import os
+import threading
 
 import adafruit_bme280
 import adafruit_ens160
@@ -20,17 +20,66 @@ from sensirion_i2c_driver import I2cConnection
 from sensirion_i2c_driver.linux_i2c_transceiver import LinuxI2cTransceiver
 from sensirion_i2c_sgp4x.sgp41 import Sgp41I2cDevice
 
+from firemark_batch import BatchAccumulator, encode_batch
+from firemark_bus import BusWriter
+from firemark_delivery import Endpoint, FanoutPoster, PostHistory
+from firemark_drdy import build_data_ready
+from firemark_dump import DumpWriter
+from firemark_sampling import LatestTable, SampleScheduler, SensorTask
+from firemark_spool import PayloadSpool
+from firemark_sysinfo import collect_health
+
+GAS_INDEX_AVAILABLE = importlib.util.find_spec("sensirion_gas_index_algorithm") is not None
+
+if GAS_INDEX_AVAILABLE:
+    from sensirion_gas_index_algorithm.voc_algorithm import VocAlgorithm
+    from sensirion_gas_index_algorithm.nox_algorithm import NoxAlgorithm
+
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
-ENDPOINTS = ["http://ferrix.local:5000/ingest", "http://ghorman.local:5000/ingest"]
+ENDPOINTS = [
+    Endpoint("http://ferrix.local:5000/ingest", timeout_s=5.0),
+    Endpoint("http://ghorman.local:5000/ingest", timeout_s=5.0),
+]
 DEVICE_ID = socket.gethostname()
-POST_HISTORY = []
+POST_HISTORY = PostHistory(capacity=5)
 LOCAL_DUMP_PATH = "/home/thebigcafeteria/latest.json"
+BUS_PATH = "/dev/shm/firemark-collector"  # shared-memory ring read by firemark-health.py
+# Set to a tmpfs path (e.g. "/dev/shm/firemark-latest.json") to coalesce dump
+# writes there and copy to LOCAL_DUMP_PATH only every DUMP_FLUSH_INTERVAL_S.
+DUMP_STAGING_PATH = None
+DUMP_FLUSH_INTERVAL_S = 300
+SPOOL_PATH = "/home/thebigcafeteria/spool.db"
+SPOOL_MAX_BYTES = 32 * 1024 * 1024
+
+# Batch mode: send every BATCH_MAX_READINGS readings (or BATCH_MAX_AGE_S worth)
+# as one columnar document. 1 posts each reading on its own.
+BATCH_MAX_READINGS = 1
+BATCH_MAX_AGE_S = 300
+BATCH_COMPRESSION = "gzip"  # "gzip", "zstd" or None
+
+# Sampling periods per sensor; publishing runs on its own fixed cadence.
+PUBLISH_INTERVAL_S = 30.0
+FIRST_PUBLISH_DELAY_S = 5.0
+BME280_PERIOD_S = 5.0
+ENS160_PERIOD_S = 5.0
+SCD41_PERIOD_S = 5.0   # SCD4x periodic mode produces a value every 5 s
+SCD30_PERIOD_S = 2.0   # SCD30 default measurement interval
+SGP41_PERIOD_S = 1.0   # SGP41 conditioning and VOC/NOx index need 1 Hz
+SGP41_CONDITIONING_S = 10.0
+
+# BCM GPIOs wired to data-ready lines, or None. A wired sensor is read as soon
+# as its line fires; the others are polled on their period.
+SCD30_RDY_PIN = None
+SMOKE_INT_PIN = None       # ADPD188BI GPIO0, asserted at the FIFO threshold
 
 LED_PIN = board.D18
 PIXEL_COUNT = 8
 PIXELS = neopixel.NeoPixel(LED_PIN, PIXEL_COUNT, brightness=0.2, auto_write=False)
+# The smoke task sets its LED from the sampler thread; NeoPixel output is not
+# thread-safe, so every change and show() after boot holds this lock.
+PIXELS_LOCK = threading.Lock()
 
 # LED index mapping
 LED_BOOT = 0
@@ -45,6 +94,23 @@ LED_ENDPOINT_B = 7
 GREEN = (0, 50, 0)
 RED = (50, 0, 0)
 BLUE = (0, 0, 50)
+AMBER = (50, 25, 0)
+
+# Endpoint LEDs turn amber when the rolling success rate drops below this.
+DEGRADED_SUCCESS_RATE = 0.9
+
+# Qwiic Alphanumeric display(s) showing CO2, e.g. (0x70,); empty to disable.
+# The display is written from its own thread at most DISPLAY_MAX_FPS times a second.
+DISPLAY_ADDRESSES = ()
+DISPLAY_MAX_FPS = 4
+
+# ADPD188BI smoke sensor (Smoke 2 Click), read through smbus2 on its own bus
+# handle. Its FIFO is drained every SMOKE_PERIOD_S and every sample goes
+# through the smoke detector; LED_BOOT shows the detector state after boot.
+SMOKE_ENABLED = False
+SMOKE_I2C_BUS = 1
+SMOKE_PERIOD_S = 0.5       # The sensor samples at 16 Hz
+SMOKE_FIFO_PACKETS = 8
 
 PIXELS.fill((0, 0, 0))
 PIXELS[LED_BOOT] = BLUE
@@ -63,153 +129,185 @@ scd30 = adafruit_scd30.SCD30(i2c)
 
 sgp_conn = I2cConnection(LinuxI2cTransceiver('/dev/i2c-1'))
 sgp41 = Sgp41I2cDevice(sgp_conn)
+sgp41_started = time.monotonic()
+voc_algorithm = VocAlgorithm() if GAS_INDEX_AVAILABLE else None
+nox_algorithm = NoxAlgorithm() if GAS_INDEX_AVAILABLE else None
+
+os.makedirs(os.path.dirname(SPOOL_PATH), exist_ok=True)
+BATCH = BatchAccumulator(BATCH_MAX_READINGS, BATCH_MAX_AGE_S) if BATCH_MAX_READINGS > 1 else None
+POSTER = FanoutPoster(
+    ENDPOINTS,
+    spool=PayloadSpool(SPOOL_PATH, max_bytes=SPOOL_MAX_BYTES),
+    drain_as_batch=BATCH is not None,
+    drain_compression=BATCH_COMPRESSION,
+)
+BUS = BusWriter(BUS_PATH)
+DUMP = DumpWriter(LOCAL_DUMP_PATH, staging_path=DUMP_STAGING_PATH, flush_interval_s=DUMP_FLUSH_INTERVAL_S)
+
+DISPLAY = None
+if DISPLAY_ADDRESSES:
+    import qwiic_alphanumeric
+
+    alpha = qwiic_alphanumeric.QwiicAlphanumeric()
+    if alpha.begin(*DISPLAY_ADDRESSES):
+        DISPLAY = qwiic_alphanumeric.QwiicAlphanumericWriter(alpha, max_fps=DISPLAY_MAX_FPS)
+        DISPLAY.start()
+    else:
+        print("[!] Alphanumeric display not found at", DISPLAY_ADDRESSES)
+
+SMOKE = None
+if SMOKE_ENABLED:
+    from smbus2 import SMBus
+    from adpd188bi import ADPD188BI
+    from firemark_smoke import SmokeDetector, STATE_CLEAR, STATE_NUISANCE, STATE_SMOKE
+
+    smoke_sensor = ADPD188BI(SMBus(SMOKE_I2C_BUS))
+    # After a restart the sensor is usually still sampling and is reused as is.
+    smoke_sensor.resume(fifo_threshold=SMOKE_FIFO_PACKETS)
+    SMOKE = SmokeDetector()
+    SMOKE_LEDS = {STATE_CLEAR: GREEN, STATE_NUISANCE: AMBER, STATE_SMOKE: RED}
 
 # ---------------------------------------------------------------------------
 # Helper functions
 # ---------------------------------------------------------------------------
 
-def collect_health():
-    def get_temp():
-        try:
-            out = subprocess.check_output(["vcgencmd", "measure_temp"]).decode()
-            return float(out.strip().split("=")[1].replace("'C", ""))
-        except Exception:
-            return None
-
-    def get_uptime():
-        try:
-            with open("/proc/uptime", "r") as f:
-                return float(f.readline().split()[0])
-        except Exception:
-            return None
-
-    def get_rssi():
-        try:
-            out = subprocess.check_output(["iwconfig", "wlan0"]).decode()
-            for line in out.split("\n"):
-                if "Signal level" in line:
-                    return int(line.split("Signal level=")[1].split(" ")[0])
-        except Exception:
-            return None
-
-    def get_latency():
-        try:
-            out = subprocess.check_output([
-                "ping", "-c", "1", "-W", "1", "ferrix.local"
-            ]).decode()
-            for line in out.split("\n"):
-                if "time=" in line:
-                    return float(line.split("time=")[1].split(" ")[0])
-        except Exception:
-            return None
-
-    def get_throttled():
-        try:
-            out = subprocess.check_output(["vcgencmd", "get_throttled"]).decode()
-            return out.strip().split("=")[1]
-        except Exception:
-            return None
+def post_payload(data):
+    results = None
+    if BATCH is None:
+        results = POSTER.post(data)
+    else:
+        BATCH.add(data)
+        if BATCH.ready():
+            results = POSTER.post_encoded(*encode_batch(BATCH.flush(), BATCH_COMPRESSION))
+
+    if results is not None:
+        timestamp = time.strftime("%H:%M:%S")
+        with PIXELS_LOCK:
+            for idx, result in enumerate(results):
+                rate = POSTER.stats.windows[result.endpoint.url].success_rate
+                if not result.ok:
+                    PIXELS[LED_ENDPOINT_A + idx] = RED
+                elif rate is not None and rate < DEGRADED_SUCCESS_RATE:
+                    PIXELS[LED_ENDPOINT_A + idx] = AMBER
+                else:
+                    PIXELS[LED_ENDPOINT_A + idx] = GREEN
+                POST_HISTORY.record(result, timestamp)
+            PIXELS.show()
 
+    try:
+        DUMP.write(dict(data, delivery=POSTER.stats.snapshot()))
+    except Exception as e:
+        print("[!] Failed to write local latest.json:", e)
+
+
+def read_bme280():
     return {
-        "cpu_temp": get_temp(),
-        "uptime": get_uptime(),
-        "rssi": get_rssi(),
-        "latency_ms": get_latency(),
-        "throttled": get_throttled(),
+        "temperature": round(bme280.temperature, 1),
+        "humidity": round(bme280.relative_humidity, 1),
+        "pressure": round(bme280.pressure, 1),
     }
 
 
-def post_payload(data):
-    timestamp = time.strftime("%H:%M:%S")
-    for idx, url in enumerate(ENDPOINTS):
-        try:
-            resp = requests.post(url, json=data, timeout=5)
-            status = resp.status_code
-            PIXELS[LED_ENDPOINT_A + idx] = GREEN if status == 200 else RED
-            POST_HISTORY.append((url.split("//")[1].split(".")[0], status, timestamp))
-        except Exception:
-            PIXELS[LED_ENDPOINT_A + idx] = RED
-            POST_HISTORY.append((url.split("//")[1].split(".")[0], "ERR", timestamp))
-    PIXELS.show()
-    while len(POST_HISTORY) > 5:
-        POST_HISTORY.pop(0)
+def compensation():
+    """Latest ambient (humidity, temperature) for gas sensor compensation."""
+    env = LATEST.get("bme280")
+    if env is None:
+        return 50.0, 25.0
+    return env["humidity"], env["temperature"]
 
-    try:
-        os.makedirs(os.path.dirname(LOCAL_DUMP_PATH), exist_ok=True)
-        with open(LOCAL_DUMP_PATH, "w") as f:
-            json.dump(data, f)
-    except Exception as e:
-        print("[!] Failed to write local latest.json:", e)
 
+def read_ens160():
+    humidity, temperature = compensation()
+    ens160.temperature = temperature
+    ens160.humidity = humidity
+    return {
+        "air_quality_index": ens160.AQI,
+        "tvoc": ens160.TVOC,
+        "eco2": ens160.eCO2,
+    }
 
-def read_sensors():
-    readings = {}
 
-    # BME280
-    try:
-        readings["bme280"] = {
-            "temperature": round(bme280.temperature, 1),
-            "humidity": round(bme280.relative_humidity, 1),
-            "pressure": round(bme280.pressure, 1),
-        }
-        PIXELS[LED_BME280] = GREEN
-    except Exception:
-        readings["bme280"] = None
-        PIXELS[LED_BME280] = RED
-
-    # ENS160
-    try:
-        ens160.temperature = bme280.temperature
-        ens160.humidity = bme280.relative_humidity
-        readings["ens160"] = {
-            "air_quality_index": ens160.AQI,
-            "tvoc": ens160.TVOC,
-            "eco2": ens160.eCO2,
-        }
-        PIXELS[LED_ENS160] = GREEN
-    except Exception:
-        readings["ens160"] = None
-        PIXELS[LED_ENS160] = RED
-
-    # SCD41
-    try:
-        if scd41.data_ready:
-            readings["scd41"] = {
-                "co2": scd41.CO2,
-                "temperature": scd41.temperature,
-                "humidity": scd41.relative_humidity,
-            }
-        PIXELS[LED_SCD41] = GREEN
-    except Exception:
-        readings.setdefault("scd41", None)
-        PIXELS[LED_SCD41] = RED
-
-    # SCD30
-    try:
-        if scd30.data_available:
-            readings["scd30"] = {
-                "co2": scd30.CO2,
-                "temperature": scd30.temperature,
-                "humidity": scd30.relative_humidity,
-            }
-        PIXELS[LED_SCD30] = GREEN
-    except Exception:
-        readings.setdefault("scd30", None)
-        PIXELS[LED_SCD30] = RED
-
-    # SGP41
-    try:
-        voc, nox = sgp41.measure_raw(
-            relative_humidity=bme280.relative_humidity,
-            temperature=bme280.temperature,
-        )
-        readings["sgp41"] = {"voc_raw": voc.raw, "nox_raw": nox.raw}
-        PIXELS[LED_SGP41] = GREEN
-    except Exception:
-        readings["sgp41"] = None
-        PIXELS[LED_SGP41] = RED
-
-    PIXELS.show()
+def read_scd41():
+    reading = {
+        "co2": scd41.CO2,
+        "temperature": scd41.temperature,
+        "humidity": scd41.relative_humidity,
+    }
+    if DISPLAY is not None:
+        # Only queues the text; the display thread does the I2C writes.
+        DISPLAY.show(f"{reading['co2']:>4}" if len(DISPLAY_ADDRESSES) == 1 else f"CO2 {reading['co2']:>4}")
+    return reading
+
+
+def read_scd30():
+    return {
+        "co2": scd30.CO2,
+        "temperature": scd30.temperature,
+        "humidity": scd30.relative_humidity,
+    }
+
+
+def read_sgp41():
+    humidity, temperature = compensation()
+    if time.monotonic() - sgp41_started < SGP41_CONDITIONING_S:
+        sgp41.conditioning(relative_humidity=humidity, temperature=temperature)
+        return None
+    voc, nox = sgp41.measure_raw(relative_humidity=humidity, temperature=temperature)
+    reading = {"voc_raw": voc.raw, "nox_raw": nox.raw}
+    if GAS_INDEX_AVAILABLE:
+        reading["voc_index"] = voc_algorithm.process(voc.raw)
+        reading["nox_index"] = nox_algorithm.process(nox.raw)
+    return reading
+
+
+def read_smoke():
+    state = SMOKE.state
+    for sample in smoke_sensor.drain():
+        event = SMOKE.update(sample.slot_a[0], sample.slot_b[0])
+        if event is not None:
+            print(f"[smoke] {event.previous} -> {event.state}"
+                  f" (blue {event.blue_rise:+.0f}, IR {event.ir_rise:+.0f})")
+    if SMOKE.state != state:
+        with PIXELS_LOCK:
+            PIXELS[LED_BOOT] = SMOKE_LEDS[SMOKE.state]
+            PIXELS.show()
+    return SMOKE.reading()
+
+
+SENSOR_LEDS = {
+    "bme280": LED_BME280,
+    "ens160": LED_ENS160,
+    "scd41": LED_SCD41,
+    "scd30": LED_SCD30,
+    "sgp41": LED_SGP41,
+}
+
+
+def data_ready_trigger(pin, ready):
+    return build_data_ready(pin, ready) if pin is not None else None
+
+
+LATEST = LatestTable()
+TASKS = [
+    SensorTask("bme280", BME280_PERIOD_S, read_bme280),
+    SensorTask("ens160", ENS160_PERIOD_S, read_ens160),
+    SensorTask("scd41", SCD41_PERIOD_S, read_scd41, ready=lambda: scd41.data_ready),
+    SensorTask("scd30", SCD30_PERIOD_S, read_scd30, ready=lambda: scd30.data_available,
+               trigger=data_ready_trigger(SCD30_RDY_PIN, lambda: scd30.data_available)),
+    SensorTask("sgp41", SGP41_PERIOD_S, read_sgp41),
+]
+if SMOKE is not None:
+    TASKS.append(SensorTask("smoke", SMOKE_PERIOD_S, read_smoke, ready=smoke_sensor.data_ready,
+                            trigger=data_ready_trigger(SMOKE_INT_PIN, smoke_sensor.data_ready)))
+SCHEDULER = SampleScheduler(TASKS, LATEST)
+
+
+def read_sensors():
+    readings, status = LATEST.snapshot()
+    with PIXELS_LOCK:
+        for name, led in SENSOR_LEDS.items():
+            PIXELS[led] = GREEN if status.get(name) else RED
+        PIXELS.show()
     return readings
 
 
@@ -220,7 +318,14 @@ def read_sensors():
 PIXELS[LED_BOOT] = GREEN
 PIXELS.show()
 
+SCHEDULER.start()
+next_publish = time.monotonic() + FIRST_PUBLISH_DELAY_S
+
 while True:
+    delay = next_publish - time.monotonic()
+    if delay > 0:
+        time.sleep(delay)
+
     sensor_data = read_sensors()
     health = collect_health()
     payload = {
@@ -231,7 +336,14 @@ while True:
     }
 
     post_payload(payload)
+    try:
+        BUS.publish(dict(payload, delivery=POSTER.stats.snapshot()), payload["ts"])
+    except Exception as e:
+        print("[!] Failed to publish to shared-memory bus:", e)
 
     print(json.dumps(payload, indent=2))
 
-    time.sleep(30)
+    next_publish += PUBLISH_INTERVAL_S
+    if next_publish < time.monotonic():
+        # A cycle overran the interval; resynchronise instead of bursting.
+        next_publish = time.monotonic()
@@ -1,60 +1,221 @@
 # firemark01_health_server.py – lightweight Flask app serving live health status
 
-from flask import Flask, jsonify
-import subprocess
+from flask import Flask, Response, request
+import hashlib
+import json
+import os
+import threading
 import time
 import socket
 
+import firemark_sysinfo as sysinfo
+from firemark_bus import BusReader
+from firemark_metrics import CONTENT_TYPE, MetricsRegistry
+
 app = Flask(__name__)
 
 DEVICE_ID = socket.gethostname()
+# Shared-memory rings published by firemark-collector.py / firemark-reporter.py
+BUS_PATHS = ["/dev/shm/firemark-collector", "/dev/shm/firemark-reporter"]
 
+# /health is served from a snapshot refreshed in the background, so scrape
+# rate does not affect how often the system is probed.
+REFRESH_INTERVAL_S = 5.0
+STALE_AFTER_S = 3 * REFRESH_INTERVAL_S
+# Fields that change on every refresh and are left out of the ETag, so a
+# client polling with If-None-Match only sees a new body when something real
+# changed. The tag is weak since the bodies it matches differ in these.
+ETAG_VOLATILE_KEYS = ("ts", "uptime")
 
-def collect_health():
-    def get_temp():
-        try:
-            out = subprocess.check_output(["vcgencmd", "measure_temp"]).decode()
-            return float(out.strip().split("=")[1].replace("'C", ""))
-        except:
-            return None
-
-    def get_uptime():
-        try:
-            with open("/proc/uptime", "r") as f:
-                return float(f.readline().split()[0])
-        except:
-            return None
-
-    def get_rssi():
-        try:
-            out = subprocess.check_output(["iwconfig", "wlan0"]).decode()
-            for line in out.split("\n"):
-                if "Signal level" in line:
-                    return int(line.split("Signal level=")[1].split(" ")[0])
-        except:
-            return None
-
-    def get_ip():
-        try:
-            return socket.gethostbyname(socket.gethostname())
-        except:
-            return "unknown"
 
+def collect_health():
     return {
         "device": DEVICE_ID,
         "ts": int(time.time()),
-        "ip": get_ip(),
-        "uptime": get_uptime(),
-        "cpu_temp": get_temp(),
-        "rssi": get_rssi(),
+        "ip": sysinfo.ip_address(),
+        "uptime": sysinfo.uptime(),
+        "cpu_temp": sysinfo.cpu_temp(),
+        "rssi": sysinfo.rssi(),
         "status": "ok"
     }
 
 
+# ---- /metrics registry (declared once, values updated on refresh) ----
+REGISTRY = MetricsRegistry()
+M_INFO = REGISTRY.gauge("firemark_device_info", "Device identity", ["device", "ip"])
+M_CPU_TEMP = REGISTRY.gauge("firemark_cpu_temperature_celsius", "SoC temperature")
+M_UPTIME = REGISTRY.gauge("firemark_uptime_seconds", "Seconds since boot")
+M_RSSI = REGISTRY.gauge("firemark_wifi_rssi_dbm", "Wi-Fi signal level")
+M_LATENCY = REGISTRY.gauge("firemark_ingest_rtt_seconds", "TCP connect time to the ingest server")
+M_THROTTLED = REGISTRY.gauge("firemark_throttled_flags", "Firmware get_throttled bit field")
+M_SENSOR = REGISTRY.gauge("firemark_sensor_value", "Latest sensor reading", ["sensor", "field"])
+M_READING_TS = REGISTRY.gauge("firemark_reading_timestamp_seconds", "Unix time of the latest reading")
+# Delivery metrics carry the publishing process as "source": the collector and
+# the reporter post to the same endpoints and keep separate counters.
+M_POSTS = REGISTRY.counter("firemark_delivery_posts", "Ingest POST attempts", ["source", "endpoint"])
+M_FAILURES = REGISTRY.counter(
+    "firemark_delivery_failures", "Ingest POSTs not answered with 200", ["source", "endpoint"]
+)
+M_POST_QUANTILE = REGISTRY.gauge(
+    "firemark_delivery_latency_window_seconds", "Rolling POST latency quantiles", ["source", "endpoint", "quantile"]
+)
+M_POST_SUCCESS = REGISTRY.gauge(
+    "firemark_delivery_success_ratio", "Rolling share of POSTs answered with 200", ["source", "endpoint"]
+)
+M_POST_RETRIES = REGISTRY.counter(
+    "firemark_delivery_retries", "Ingest POST connect retries", ["source", "endpoint"]
+)
+M_POST_LATENCY = None  # histogram; created once the bucket layout is known
+
+_bus_readers = {}
+_bus_counts = {}
+_sensor_keys = set()
+
+
+def _new_readings():
+    """Latest ``(source, reading)`` of every bus, or None if no bus has published since last call.
+
+    ``source`` is the bus file name, e.g. "firemark-collector".
+    """
+    changed = False
+    readings = []
+    for path in BUS_PATHS:
+        reader = _bus_readers.get(path)
+        if reader is None:
+            try:
+                reader = _bus_readers[path] = BusReader(path)
+            except (OSError, ValueError):
+                continue
+        count = reader.count()
+        record = reader.latest()
+        if record is None:
+            continue
+        if count != _bus_counts.get(path):
+            _bus_counts[path] = count
+            changed = True
+        readings.append((os.path.basename(path), record[1]))
+    return readings if changed else None
+
+
+def _sensor_fields(value, path, out):
+    if isinstance(value, dict):
+        for key, child in value.items():
+            _sensor_fields(child, path + [str(key)], out)
+    elif isinstance(value, (int, float)) and not isinstance(value, bool) and len(path) > 1:
+        out[(".".join(path[:-1]), path[-1])] = value
+
+
+def refresh_metrics(health):
+    global _sensor_keys, M_POST_LATENCY
+
+    M_INFO.set(1, device=DEVICE_ID, ip=health["ip"])
+    M_CPU_TEMP.set(health["cpu_temp"])
+    M_UPTIME.set(health["uptime"])
+    M_RSSI.set(health["rssi"])
+    latency = sysinfo.latency_ms()
+    M_LATENCY.set(latency / 1000.0 if latency is not None else None)
+    throttled = sysinfo.throttled()
+    M_THROTTLED.set(int(throttled, 16) if throttled else None)
+
+    readings = _new_readings()
+    if readings is None:
+        REGISTRY.render()
+        return
+
+    fields = {}
+    for _, reading in readings:
+        for key, value in reading.items():
+            if key not in ("device", "ts", "health", "delivery"):
+                # Collector nests readings under "sensors"; the reporter does not.
+                _sensor_fields(value, [] if key == "sensors" else [key], fields)
+    for sensor, field in _sensor_keys - fields.keys():
+        M_SENSOR.remove(sensor=sensor, field=field)
+    for (sensor, field), value in fields.items():
+        M_SENSOR.set(value, sensor=sensor, field=field)
+    _sensor_keys = set(fields)
+    M_READING_TS.set(max(r.get("ts") or 0 for _, r in readings))
+
+    for source, reading in readings:
+        delivery = reading.get("delivery") or {}
+        if M_POST_LATENCY is None and "latency_buckets_s" in delivery:
+            M_POST_LATENCY = REGISTRY.histogram(
+                "firemark_delivery_latency_seconds",
+                "Ingest POST latency",
+                delivery["latency_buckets_s"],
+                ["source", "endpoint"],
+            )
+        # Keyed by endpoint URL: short names are not unique across endpoints.
+        for url, stats in delivery.get("endpoints", {}).items():
+            M_POSTS.set(stats["posts"], source=source, endpoint=url)
+            M_FAILURES.set(stats["failures"], source=source, endpoint=url)
+            M_POST_RETRIES.set(stats.get("retries"), source=source, endpoint=url)
+            window = stats.get("window") or {}
+            for quantile in ("p50", "p95", "p99"):
+                M_POST_QUANTILE.set(window.get(quantile), source=source, endpoint=url, quantile="0." + quantile[1:])
+            M_POST_SUCCESS.set(window.get("success_rate"), source=source, endpoint=url)
+            if M_POST_LATENCY is not None:
+                M_POST_LATENCY.set_histogram(
+                    stats["latency_buckets"], stats["latency_sum"], stats["posts"], source=source, endpoint=url
+                )
+
+    REGISTRY.render()
+
+
+def _render(health):
+    body = json.dumps(health, separators=(",", ":")).encode("utf-8")
+    stable = {k: v for k, v in health.items() if k not in ETAG_VOLATILE_KEYS}
+    digest = hashlib.sha1(json.dumps(stable, sort_keys=True, separators=(",", ":")).encode("utf-8"))
+    return body, 'W/"%s"' % digest.hexdigest()[:16]
+
+
+# (refreshed_at, fresh (body, etag), stale (body, etag)); replaced as a whole.
+_snapshot = None
+
+
+def refresh_snapshot():
+    global _snapshot
+    health = collect_health()
+    try:
+        refresh_metrics(health)
+    except Exception as e:
+        print("[!] Metrics refresh failed:", e)
+    health["stale"] = False
+    fresh = _render(health)
+    health["stale"] = True
+    health["status"] = "stale"
+    stale = _render(health)
+    _snapshot = (time.monotonic(), fresh, stale)
+
+
+def _refresh_loop():
+    while True:
+        time.sleep(REFRESH_INTERVAL_S)
+        try:
+            refresh_snapshot()
+        except Exception as e:
+            print("[!] Health refresh failed:", e)
+
+
+refresh_snapshot()
+threading.Thread(target=_refresh_loop, name="health-refresh", daemon=True).start()
+
+
 @app.route("/health")
 def health():
-    return jsonify(collect_health())
+    refreshed_at, fresh, stale = _snapshot
+    age = time.monotonic() - refreshed_at
+    body, etag = stale if age > STALE_AFTER_S else fresh
+    headers = {"ETag": etag, "Age": str(int(age)), "Cache-Control": "no-cache"}
+
+    if request.if_none_match.contains_weak(etag[2:].strip('"')):
+        return Response(status=304, headers=headers)
+    return Response(body, mimetype="application/json", headers=headers)
+
+
+@app.route("/metrics")
+def metrics():
+    return Response(REGISTRY.rendered, content_type=CONTENT_TYPE)
 
 
 if __name__ == "__main__":
-    app.run(host="0.0.0.0", port=5001, debug=False)
+    app.run(host="0.0.0.0", port=5001, debug=False, threaded=True)
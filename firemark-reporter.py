@@ -1,33 +1,33 @@
 # firemark01_reporter.py — Unified AQI5 + ENV3 dashboard with POST history and system health
 
 import time
-import requests
 import board
 import busio
 import adafruit_bme680
 from smbus2 import SMBus
 from datetime import datetime
 import os
-import subprocess
 import socket
-import json
+
+from ads1015 import ADS1015
+from firemark_batch import BatchAccumulator, encode_batch
+from firemark_bus import BusWriter
+from firemark_delivery import Endpoint, FanoutPoster, PostHistory
+from firemark_drdy import build_data_ready
+from firemark_dump import DumpWriter
+from firemark_sysinfo import collect_health
 
 # ---- AQI5 Setup (ADS1015 via SMBus) ----
 AQI5_ADDR = 0x48
-CHANNEL_CONFIGS = {
-    'CO':   0xC183,
-    'NH3':  0xD183,
-    'NO2':  0xE183
+AQI5_CHANNELS = {
+    'CO':   0,  # AIN0
+    'NH3':  1,  # AIN1
+    'NO2':  2,  # AIN2
 }
-
-def read_ads1015(bus, config):
-    bus.write_i2c_block_data(AQI5_ADDR, 0x01, [(config >> 8) & 0xFF, config & 0xFF])
-    time.sleep(0.01)
-    raw = bus.read_word_data(AQI5_ADDR, 0x00)
-    value = ((raw & 0xFF) << 8) | (raw >> 8)
-    if value & 0x8000:
-        value -= 1 << 16
-    return value
+AQI5_DATA_RATE = 1600      # Samples per second
+AQI5_FULL_SCALE = 6.144    # Volts
+AQI5_OVERSAMPLE = 32       # Continuous-mode conversions averaged per gas (~20 ms at 1600 SPS)
+AQI5_READY_PIN = None      # BCM GPIO wired to ALERT/RDY, or None to time conversions
 
 # ---- ENV3 Setup (BME688 via Adafruit lib) ----
 i2c = busio.I2C(board.SCL, board.SDA)
@@ -35,75 +35,47 @@ bme = adafruit_bme680.Adafruit_BME680_I2C(i2c, address=0x76)
 bme.sea_level_pressure = 1013.25
 
 # ---- POST Config ----
-ENDPOINTS = ["http://ferrix.local:5000/ingest", "http://ghorman.local:5000/ingest"]
+ENDPOINTS = [
+    Endpoint("http://ferrix.local:5000/ingest", timeout_s=5.0),
+    Endpoint("http://ghorman.local:5000/ingest", timeout_s=5.0),
+]
 DEVICE_ID = socket.gethostname()
-POST_HISTORY = []
+POST_HISTORY = PostHistory(capacity=5)
 LOCAL_DUMP_PATH = f"/home/thebigcafeteria/latest.json"
-
-def collect_health():
-    def get_temp():
-        try:
-            out = subprocess.check_output(["vcgencmd", "measure_temp"]).decode()
-            return float(out.strip().split("=")[1].replace("'C", ""))
-        except:
-            return None
-
-    def get_uptime():
-        try:
-            with open("/proc/uptime", "r") as f:
-                return float(f.readline().split()[0])
-        except:
-            return None
-
-    def get_rssi():
-        try:
-            out = subprocess.check_output(["iwconfig", "wlan0"]).decode()
-            for line in out.split("\n"):
-                if "Signal level" in line:
-                    return int(line.split("Signal level=")[1].split(" ")[0])
-        except:
-            return None
-
-    def get_latency():
-        try:
-            out = subprocess.check_output(["ping", "-c", "1", "-W", "1", "ferrix.local"]).decode()
-            for line in out.split("\n"):
-                if "time=" in line:
-                    return float(line.split("time=")[1].split(" ")[0])
-        except:
-            return None
-
-    def get_throttled():
-        try:
-            out = subprocess.check_output(["vcgencmd", "get_throttled"]).decode()
-            return out.strip().split("=")[1]
-        except:
-            return None
-
-    return {
-        "cpu_temp": get_temp(),
-        "uptime": get_uptime(),
-        "rssi": get_rssi(),
-        "latency_ms": get_latency(),
-        "throttled": get_throttled()
-    }
+BUS_PATH = "/dev/shm/firemark-reporter"  # shared-memory ring read by firemark-health.py
+# Set to a tmpfs path (e.g. "/dev/shm/firemark-latest.json") to coalesce dump
+# writes there and copy to LOCAL_DUMP_PATH only every DUMP_FLUSH_INTERVAL_S.
+DUMP_STAGING_PATH = None
+DUMP_FLUSH_INTERVAL_S = 300
+
+# Batch mode: send every BATCH_MAX_READINGS readings (or BATCH_MAX_AGE_S worth)
+# as one columnar document. 1 posts each reading on its own.
+BATCH_MAX_READINGS = 1
+BATCH_MAX_AGE_S = 300
+BATCH_COMPRESSION = "gzip"  # "gzip", "zstd" or None
+
+POSTER = FanoutPoster(ENDPOINTS)
+BATCH = BatchAccumulator(BATCH_MAX_READINGS, BATCH_MAX_AGE_S) if BATCH_MAX_READINGS > 1 else None
+BUS = BusWriter(BUS_PATH)
+DUMP = DumpWriter(LOCAL_DUMP_PATH, staging_path=DUMP_STAGING_PATH, flush_interval_s=DUMP_FLUSH_INTERVAL_S)
 
 def post_payload(data):
-    timestamp = datetime.now().strftime('%H:%M:%S')
-    for url in ENDPOINTS:
-        try:
-            resp = requests.post(url, json=data, timeout=5)
-            POST_HISTORY.append((url.split('//')[1].split('.')[0], resp.status_code, timestamp))
-        except Exception as e:
-            POST_HISTORY.append((url.split('//')[1].split('.')[0], "ERR", timestamp))
-    while len(POST_HISTORY) > 5:
-        POST_HISTORY.pop(0)
-
-    # Write last known payload to local file for /health server
+    results = None
+    if BATCH is None:
+        results = POSTER.post(data)
+    else:
+        BATCH.add(data)
+        if BATCH.ready():
+            results = POSTER.post_encoded(*encode_batch(BATCH.flush(), BATCH_COMPRESSION))
+
+    if results is not None:
+        timestamp = datetime.now().strftime('%H:%M:%S')
+        for result in results:
+            POST_HISTORY.record(result, timestamp)
+
+    # Write last known payload to local file (skipped if nothing meaningful changed)
     try:
-        os.makedirs(os.path.dirname(LOCAL_DUMP_PATH), exist_ok=True)
-        with open(LOCAL_DUMP_PATH, "w") as f:
-            json.dump(data, f)
+        DUMP.write(dict(data, delivery=POSTER.stats.snapshot()))
     except Exception as e:
         print("[!] Failed to write local latest.json:", e)
 
@@ -112,12 +84,18 @@ def clear():
 
 # ---- Main Loop ----
 bus = SMBus(1)
+aqi5 = ADS1015(
+    bus, AQI5_ADDR, data_rate=AQI5_DATA_RATE, full_scale=AQI5_FULL_SCALE,
+    # Without a GPIO backend this falls back to polling, which the driver does with the OS bit.
+    ready=build_data_ready(AQI5_READY_PIN, lambda: False, active_high=False) if AQI5_READY_PIN is not None else None,
+)
 
 while True:
     clear()
 
     # Read AQI5
-    aqi_readings = {gas: read_ads1015(bus, cfg) for gas, cfg in CHANNEL_CONFIGS.items()}
+    aqi_readings = {gas: round(raw) for gas, raw in aqi5.scan_average(AQI5_CHANNELS, AQI5_OVERSAMPLE).items()}
+    aqi5.stop()
 
     # Read ENV3
     env = {
@@ -141,6 +119,10 @@ while True:
 
     # POST + dump
     post_payload(payload)
+    try:
+        BUS.publish(dict(payload, delivery=POSTER.stats.snapshot()), payload["ts"])
+    except Exception as e:
+        print("[!] Failed to publish to shared-memory bus:", e)
 
     # Display
     print("╔═══════════════ FIREMARK STATUS ═════════════════╗")
@@ -151,9 +133,17 @@ while True:
     print("╠═══════════════ SYSTEM HEALTH ═══════════════════╣")
     print(f"║  CPU Temp: {health['cpu_temp']}°C  RSSI: {health['rssi']}dBm  Latency: {health['latency_ms']}ms  ║")
     print("╠══════════════ POST HISTORY (Last 5) ═════════════╣")
-    for name, status, ts in reversed(POST_HISTORY):
-        stat = "[✓]" if status == 200 else "[X]"
-        print(f"║  {stat} {name:<8} {str(status):<8} @ {ts}                    ║")
+    for rec in reversed(POST_HISTORY):
+        stat = "[✓]" if rec.status == 200 else "[X]"
+        ms = f"{rec.duration_s * 1000:.0f}ms"
+        print(f"║  {stat} {rec.host:<8} {str(rec.status):<4} {ms:>7} r{rec.retries} @ {rec.timestamp}          ║")
+    print("╠═════════════ DELIVERY (rolling window) ══════════╣")
+    for endpoint in POSTER.endpoints:
+        w = POSTER.stats.windows[endpoint.url].summary()
+        if not w["samples"]:
+            continue
+        print(f"║  {endpoint.name:<8} p50 {w['p50'] * 1000:>5.0f}  p95 {w['p95'] * 1000:>5.0f}  "
+              f"p99 {w['p99'] * 1000:>5.0f}ms  ok {w['success_rate']:>4.0%} ║")
     print("╚══════════════════════════════════════════════════╝")
 
     time.sleep(30)
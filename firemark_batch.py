@@ -0,0 +1,116 @@
+"""Columnar multi-reading batch format for the /ingest servers.
+
+A batch document looks like::
+
+    {
+      "schema": "firemark.batch/1",
+      "device": "firemark01",
+      "count": 3,
+      "ts": [1700000000, 1700000030, 1700000060],
+      "columns": {
+        "sensors.bme280.temperature": [21.4, 21.5, null],
+        ...
+      }
+    }
+
+Nested reading dicts are flattened to dotted column names, and each column
+holds one value per reading (``null`` where a reading lacks that field). It is
+sent with ``Content-Type: application/vnd.firemark.batch+json; version=1`` and
+optionally a gzip or zstd ``Content-Encoding``, so servers can tell it apart
+from the single-reading JSON documents.
+"""
+
+import gzip
+import importlib.util
+import json
+import time
+from typing import Dict, List, Optional, Tuple
+
+
+ZSTD_AVAILABLE = importlib.util.find_spec("zstandard") is not None
+
+if ZSTD_AVAILABLE:
+    import zstandard
+
+
+BATCH_SCHEMA = "firemark.batch/1"
+BATCH_CONTENT_TYPE = "application/vnd.firemark.batch+json; version=1"
+
+# Top-level keys that are constant for a device or carried separately.
+_HOISTED_KEYS = ("device", "ts")
+
+
+def _flatten(value: object, prefix: str, out: Dict[str, object]) -> None:
+    if isinstance(value, dict):
+        for key, child in value.items():
+            _flatten(child, f"{prefix}.{key}" if prefix else str(key), out)
+    else:
+        out[prefix] = value
+
+
+class BatchAccumulator:
+    """Collect readings until ``max_readings`` are held or the oldest is ``max_age_s`` old."""
+
+    def __init__(self, max_readings: int, max_age_s: float) -> None:
+        self.max_readings = max_readings
+        self.max_age_s = max_age_s
+        self._device: Optional[str] = None
+        self._ts: List[object] = []
+        self._columns: Dict[str, List[object]] = {}
+        self._first_added = 0.0
+
+    def __len__(self) -> int:
+        return len(self._ts)
+
+    def add(self, reading: dict) -> None:
+        if not self._ts:
+            self._first_added = time.monotonic()
+        self._device = reading.get("device", self._device)
+
+        flat: Dict[str, object] = {}
+        for key, value in reading.items():
+            if key not in _HOISTED_KEYS:
+                _flatten(value, str(key), flat)
+
+        row = len(self._ts)
+        self._ts.append(reading.get("ts"))
+        for name, value in flat.items():
+            column = self._columns.get(name)
+            if column is None:
+                column = self._columns[name] = [None] * row
+            column.append(value)
+        for column in self._columns.values():
+            if len(column) == row:
+                column.append(None)
+
+    def ready(self) -> bool:
+        if not self._ts:
+            return False
+        return (
+            len(self._ts) >= self.max_readings
+            or time.monotonic() - self._first_added >= self.max_age_s
+        )
+
+    def flush(self) -> dict:
+        """Return the batch document for everything held and start a new batch."""
+        batch = {
+            "schema": BATCH_SCHEMA,
+            "device": self._device,
+            "count": len(self._ts),
+            "ts": self._ts,
+            "columns": self._columns,
+        }
+        self._ts = []
+        self._columns = {}
+        return batch
+
+
+def encode_batch(batch: dict, compression: Optional[str] = "gzip") -> Tuple[bytes, str, Optional[str]]:
+    """Serialise ``batch``; returns ``(body, content_type, content_encoding)``."""
+    body = json.dumps(batch, separators=(",", ":")).encode("utf-8")
+    if compression == "zstd" and ZSTD_AVAILABLE:
+        return zstandard.ZstdCompressor(level=10).compress(body), BATCH_CONTENT_TYPE, "zstd"
+    # zstd falls back to gzip on hosts without the zstandard package.
+    if compression in ("gzip", "zstd"):
+        return gzip.compress(body, compresslevel=6), BATCH_CONTENT_TYPE, "gzip"
+    return body, BATCH_CONTENT_TYPE, None
@@ -0,0 +1,138 @@
+"""Shared-memory ring of the latest readings, one writer and any number of readers.
+
+The ring lives in a file on tmpfs (``/dev/shm``) mapped by every process, so
+handing a reading over never touches the SD card and readers never re-open
+or re-read a file. The layout is fixed::
+
+    header  (64 bytes)
+      0  8s  magic  b"FMBUS1\\0\\0"
+      8  I   slot count
+     12  I   slot size in bytes (including the slot header)
+     16  Q   records written so far (the newest is at index (n - 1) % slots)
+    slot    (slot size bytes each, after the header)
+      0  Q   sequence: odd while the slot is being written, even when stable
+      8  d   wall-clock timestamp of the reading
+     16  I   payload length
+     20  I   CRC-32 of the payload
+     24  ... payload: compact UTF-8 JSON of the reading
+
+Readers take no locks: they copy a slot and keep it only if the sequence
+was even and unchanged around the copy and the CRC matches, so a write in
+progress is retried instead of being returned torn.
+"""
+
+import json
+import mmap
+import os
+import struct
+import zlib
+from typing import List, Optional, Tuple
+
+
+MAGIC = b"FMBUS1\0\0"
+HEADER = struct.Struct("<8sIIQ")
+HEADER_SIZE = 64
+SLOT_HEADER = struct.Struct("<QdII")
+SEQ = struct.Struct("<Q")
+COUNT_OFFSET = 16
+
+DEFAULT_SLOTS = 16
+DEFAULT_SLOT_SIZE = 4096
+READ_RETRIES = 5
+
+
+class BusWriter:
+    def __init__(self, path: str, slots: int = DEFAULT_SLOTS, slot_size: int = DEFAULT_SLOT_SIZE) -> None:
+        self.path = path
+        self.slots = slots
+        self.slot_size = slot_size
+        size = HEADER_SIZE + slots * slot_size
+
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            existing = os.fstat(fd).st_size
+            if existing != size:
+                os.ftruncate(fd, size)
+            self._map = mmap.mmap(fd, size)
+        finally:
+            os.close(fd)
+
+        magic, old_slots, old_size, count = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or old_slots != slots or old_size != slot_size:
+            self._map[:size] = bytes(size)
+            count = 0
+        # Keep the record count across restarts so readers see new data as new.
+        HEADER.pack_into(self._map, 0, MAGIC, slots, slot_size, count)
+        self._count = count
+
+    def publish(self, reading: dict, ts: float) -> None:
+        payload = json.dumps(reading, separators=(",", ":")).encode("utf-8")
+        if len(payload) > self.slot_size - SLOT_HEADER.size:
+            raise ValueError(f"reading is {len(payload)} bytes, slot holds {self.slot_size - SLOT_HEADER.size}")
+
+        offset = HEADER_SIZE + (self._count % self.slots) * self.slot_size
+        # Always go odd then even, even if a writer died mid-write and left
+        # the slot odd; adding to an odd sequence would keep it odd for good.
+        seq = SEQ.unpack_from(self._map, offset)[0] | 1
+        SEQ.pack_into(self._map, offset, seq)
+        SLOT_HEADER.pack_into(self._map, offset, seq, ts, len(payload), zlib.crc32(payload))
+        start = offset + SLOT_HEADER.size
+        self._map[start:start + len(payload)] = payload
+        SEQ.pack_into(self._map, offset, seq + 1)
+
+        self._count += 1
+        struct.pack_into("<Q", self._map, COUNT_OFFSET, self._count)
+
+    def close(self) -> None:
+        self._map.close()
+
+
+class BusReader:
+    def __init__(self, path: str) -> None:
+        self.path = path
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            self._map = mmap.mmap(fd, 0, prot=mmap.PROT_READ)
+        finally:
+            os.close(fd)
+        magic, self.slots, self.slot_size, _ = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            self._map.close()
+            raise ValueError(f"{path} is not a firemark bus")
+
+    def count(self) -> int:
+        """Records written so far; changes whenever a new reading lands."""
+        return struct.unpack_from("<Q", self._map, COUNT_OFFSET)[0]
+
+    def _read_slot(self, index: int) -> Optional[Tuple[float, dict]]:
+        offset = HEADER_SIZE + index * self.slot_size
+        for _ in range(READ_RETRIES):
+            seq, ts, length, crc = SLOT_HEADER.unpack_from(self._map, offset)
+            if seq & 1 or length > self.slot_size - SLOT_HEADER.size:
+                continue
+            start = offset + SLOT_HEADER.size
+            payload = self._map[start:start + length]
+            if SEQ.unpack_from(self._map, offset)[0] != seq or zlib.crc32(payload) != crc:
+                continue
+            return ts, json.loads(payload)
+        return None
+
+    def latest(self) -> Optional[Tuple[float, dict]]:
+        """``(ts, reading)`` of the newest record, or None."""
+        count = self.count()
+        if count == 0:
+            return None
+        return self._read_slot((count - 1) % self.slots)
+
+    def history(self, n: int) -> List[Tuple[float, dict]]:
+        """Up to ``n`` newest records, oldest first."""
+        count = self.count()
+        records = []
+        for i in range(max(count - min(n, self.slots), 0), count):
+            record = self._read_slot(i % self.slots)
+            if record is not None:
+                records.append(record)
+        return records
+
+    def close(self) -> None:
+        self._map.close()
@@ -0,0 +1,410 @@
+"""Parallel HTTP delivery of Firemark payloads to the ingest servers."""
+
+import bisect
+import ipaddress
+import json
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Deque, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import MaxRetryError
+from urllib3.util.retry import Retry
+
+from firemark_batch import BatchAccumulator, encode_batch
+from firemark_spool import PayloadSpool, SpooledPayload
+
+
+DEFAULT_TIMEOUT_S = 5.0
+CONNECT_TIMEOUT_S = 2.0
+DRAIN_BATCH = 50
+DRAIN_COMPRESSION = "gzip"
+RESULT_GRACE_S = 0.5
+# Immediate reconnect attempts after a failed TCP connect (flaky Wi-Fi).
+CONNECT_RETRIES = 1
+LATENCY_BUCKETS_S = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+LATENCY_WINDOW = 64
+
+
+@dataclass
+class Endpoint:
+    url: str
+    timeout_s: float = DEFAULT_TIMEOUT_S
+
+    @property
+    def name(self) -> str:
+        """Short label for displays; not unique, so stats are keyed by ``url``."""
+        host = urlsplit(self.url).hostname or self.url
+        try:
+            ipaddress.ip_address(host)
+            return host
+        except ValueError:
+            return host.split(".")[0]
+
+
+@dataclass
+class DeliveryResult:
+    endpoint: Endpoint
+    status: Union[int, str]  # HTTP status code, or "ERR"
+    elapsed_s: float
+    drained: int = 0  # spooled backlog entries delivered after this post
+    response_bytes: int = 0
+    retries: int = 0
+
+    @property
+    def ok(self) -> bool:
+        return self.status == 200
+
+
+@dataclass
+class PostRecord:
+    host: str
+    status: Union[int, str]
+    timestamp: str  # HH:MM:SS
+    duration_s: float
+    response_bytes: int
+    retries: int
+
+
+class PostHistory:
+    """Fixed-capacity ring of the most recent POST outcomes, oldest first."""
+
+    def __init__(self, capacity: int = 5) -> None:
+        self._records: Deque[PostRecord] = deque(maxlen=capacity)
+
+    def record(self, result: DeliveryResult, timestamp: str) -> None:
+        self._records.append(PostRecord(
+            result.endpoint.name,
+            result.status,
+            timestamp,
+            result.elapsed_s,
+            result.response_bytes,
+            result.retries,
+        ))
+
+    def __iter__(self) -> Iterator[PostRecord]:
+        return iter(self._records)
+
+    def __reversed__(self) -> Iterator[PostRecord]:
+        return reversed(self._records)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+
+class LatencyWindow:
+    """Latency and success rate over the last ``size`` posts, updated per sample.
+
+    Samples are kept both in arrival order (to know which one to evict) and in
+    a sorted list maintained by bisection, so quantiles are a single index.
+    """
+
+    def __init__(self, size: int = LATENCY_WINDOW) -> None:
+        self.size = size
+        self._arrivals: Deque[Tuple[float, bool]] = deque()
+        self._sorted: List[float] = []
+        self._successes = 0
+
+    def add(self, latency_s: float, ok: bool) -> None:
+        if len(self._arrivals) == self.size:
+            old_latency, old_ok = self._arrivals.popleft()
+            del self._sorted[bisect.bisect_left(self._sorted, old_latency)]
+            self._successes -= old_ok
+        self._arrivals.append((latency_s, ok))
+        bisect.insort(self._sorted, latency_s)
+        self._successes += ok
+
+    def quantile(self, q: float) -> Optional[float]:
+        if not self._sorted:
+            return None
+        return self._sorted[min(int(q * len(self._sorted)), len(self._sorted) - 1)]
+
+    @property
+    def success_rate(self) -> Optional[float]:
+        if not self._arrivals:
+            return None
+        return self._successes / len(self._arrivals)
+
+    def summary(self) -> dict:
+        return {
+            "p50": self.quantile(0.50),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+            "success_rate": self.success_rate,
+            "samples": len(self._arrivals),
+        }
+
+
+class DeliveryStats:
+    """Per-endpoint counters, a latency histogram and a rolling LatencyWindow.
+
+    Everything is keyed by endpoint URL; the short name rides along for display.
+    """
+
+    def __init__(self, endpoints: Sequence[Endpoint]) -> None:
+        self._stats = {
+            e.url: {
+                "name": e.name,
+                "posts": 0,
+                "failures": 0,
+                "retries": 0,
+                "response_bytes": 0,
+                "latency_buckets": [0] * len(LATENCY_BUCKETS_S),
+                "latency_sum": 0.0,
+            }
+            for e in endpoints
+        }
+        self.windows = {e.url: LatencyWindow() for e in endpoints}
+
+    def record(self, result: DeliveryResult) -> None:
+        stats = self._stats[result.endpoint.url]
+        stats["posts"] += 1
+        if not result.ok:
+            stats["failures"] += 1
+        stats["retries"] += result.retries
+        stats["response_bytes"] += result.response_bytes
+        stats["latency_sum"] += result.elapsed_s
+        buckets = stats["latency_buckets"]
+        for i, bound in enumerate(LATENCY_BUCKETS_S):
+            if result.elapsed_s <= bound:
+                buckets[i] += 1
+        self.windows[result.endpoint.url].add(result.elapsed_s, result.ok)
+
+    def snapshot(self) -> dict:
+        """JSON-friendly copy; bucket counts are cumulative, as in LATENCY_BUCKETS_S."""
+        return {
+            "latency_buckets_s": list(LATENCY_BUCKETS_S),
+            "endpoints": {
+                url: dict(
+                    stats,
+                    latency_buckets=list(stats["latency_buckets"]),
+                    window=self.windows[url].summary(),
+                )
+                for url, stats in self._stats.items()
+            },
+        }
+
+
+class _CountingRetry(Retry):
+    """Retry that records on MaxRetryError how many retries came before it."""
+
+    def increment(self, *args, **kwargs) -> Retry:
+        try:
+            return super().increment(*args, **kwargs)
+        except MaxRetryError as e:
+            e.retries = len(self.history)
+            raise
+
+
+def _accepted(status: Union[int, str]) -> bool:
+    return isinstance(status, int) and 200 <= status < 300
+
+
+def _retryable(status: Union[int, str]) -> bool:
+    # Transport errors, throttling and server errors are worth retrying later;
+    # any other 4xx means the server will never accept this body.
+    return status == "ERR" or status in (408, 429) or status >= 500
+
+
+def _as_endpoint(entry: Union[str, Endpoint]) -> Endpoint:
+    return entry if isinstance(entry, Endpoint) else Endpoint(entry)
+
+
+class FanoutPoster:
+    """Post each payload to every endpoint at once over keep-alive sessions.
+
+    Every endpoint has its own session (so a dead host never holds a pooled
+    connection another host needs) and its own deadline, measured from the
+    moment the fan-out starts. A cycle therefore takes as long as the slowest
+    endpoint that answers in time, not the sum of all of them.
+
+    With a ``spool``, a body an endpoint does not acknowledge is queued for it
+    on disk. The next time that endpoint accepts a live post, its backlog is
+    drained oldest-first for whatever is left of its deadline, ``drain_batch``
+    rows at a time, each row as it was spooled. With ``drain_as_batch`` (for
+    senders already in batch mode) consecutive single-reading JSON rows go out
+    together as one firemark_batch document instead. Rows leave the spool only
+    on a 2xx; a body the endpoint refuses outright is dead-lettered. Only one
+    worker drains a given endpoint at a time.
+    """
+
+    def __init__(
+        self,
+        endpoints: Sequence[Union[str, Endpoint]],
+        spool: Optional[PayloadSpool] = None,
+        drain_batch: int = DRAIN_BATCH,
+        drain_as_batch: bool = False,
+        drain_compression: Optional[str] = DRAIN_COMPRESSION,
+    ) -> None:
+        self.endpoints = [_as_endpoint(e) for e in endpoints]
+        self.spool = spool
+        self.drain_batch = drain_batch
+        self.drain_as_batch = drain_as_batch
+        self.drain_compression = drain_compression
+        self._drain_locks = {e.url: threading.Lock() for e in self.endpoints}
+        self.stats = DeliveryStats(self.endpoints)
+        self._sessions: Dict[str, requests.Session] = {}
+        for endpoint in self.endpoints:
+            session = requests.Session()
+            retry = _CountingRetry(total=CONNECT_RETRIES, connect=CONNECT_RETRIES, read=0, status=0, redirect=0)
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=2, max_retries=retry)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            self._sessions[endpoint.url] = session
+        # Two workers per endpoint: a request still hung past its deadline
+        # must not stop the next cycle from reaching the same host.
+        self._executor = ThreadPoolExecutor(
+            max_workers=2 * max(len(self.endpoints), 1),
+            thread_name_prefix="firemark-post",
+        )
+
+    def _send(
+        self,
+        endpoint: Endpoint,
+        body: bytes,
+        content_type: str,
+        content_encoding: Optional[str],
+        deadline: float,
+    ) -> Tuple[Union[int, str], int, int]:
+        """POST one body; returns ``(status, response_bytes, retries)``."""
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return "ERR", 0, 0
+        headers = {"Content-Type": content_type}
+        if content_encoding:
+            headers["Content-Encoding"] = content_encoding
+        try:
+            resp = self._sessions[endpoint.url].post(
+                endpoint.url,
+                data=body,
+                headers=headers,
+                timeout=(min(CONNECT_TIMEOUT_S, remaining), remaining),
+            )
+            history = getattr(getattr(resp.raw, "retries", None), "history", ())
+            return resp.status_code, len(resp.content), len(history)
+        except requests.ConnectionError as e:
+            # requests wraps urllib3's MaxRetryError; a failure that never
+            # reached the retry logic counts as none.
+            reason = e.args[0] if e.args else None
+            return "ERR", 0, getattr(reason, "retries", 0)
+        except Exception:
+            return "ERR", 0, 0
+
+    def _drain_requests(
+        self, rows: List[SpooledPayload]
+    ) -> Iterator[Tuple[List[int], bytes, str, Optional[str]]]:
+        """Group spooled rows into ``(ids, body, content_type, content_encoding)`` requests."""
+        if not self.drain_as_batch:
+            for row in rows:
+                yield [row.id], row.body, row.content_type, row.content_encoding
+            return
+        run: List[SpooledPayload] = []
+        for row in rows + [None]:
+            if row is not None and row.content_type == "application/json" and row.content_encoding is None:
+                run.append(row)
+                continue
+            if len(run) == 1:
+                yield [run[0].id], run[0].body, run[0].content_type, None
+            elif run:
+                batch = BatchAccumulator(len(run), float("inf"))
+                for item in run:
+                    batch.add(json.loads(item.body))
+                yield ([item.id for item in run], *encode_batch(batch.flush(), self.drain_compression))
+            run = []
+            if row is not None:
+                yield [row.id], row.body, row.content_type, row.content_encoding
+
+    def _drain(self, endpoint: Endpoint, deadline: float) -> int:
+        lock = self._drain_locks[endpoint.url]
+        if not lock.acquire(blocking=False):
+            # Another worker is already replaying this backlog; sending the
+            # same rows twice would duplicate them on the server.
+            return 0
+        try:
+            delivered = 0
+            while time.monotonic() < deadline:
+                rows = self.spool.peek(endpoint.url, self.drain_batch)
+                if not rows:
+                    break
+                for ids, body, content_type, content_encoding in self._drain_requests(rows):
+                    status = self._send(endpoint, body, content_type, content_encoding, deadline)[0]
+                    if _accepted(status):
+                        self.spool.ack(ids)
+                        delivered += len(ids)
+                    elif _retryable(status):
+                        return delivered
+                    else:
+                        # Resending will not help, but the rows are kept for inspection.
+                        self.spool.reject(ids, status)
+            return delivered
+        finally:
+            lock.release()
+
+    def _post_one(
+        self,
+        endpoint: Endpoint,
+        body: bytes,
+        content_type: str,
+        content_encoding: Optional[str],
+        start: float,
+    ) -> DeliveryResult:
+        deadline = start + endpoint.timeout_s
+        status, response_bytes, retries = self._send(
+            endpoint, body, content_type, content_encoding, deadline
+        )
+        elapsed = time.monotonic() - start
+        drained = 0
+        if self.spool is not None:
+            try:
+                if status == 200:
+                    drained = self._drain(endpoint, deadline)
+                elif _retryable(status):
+                    self.spool.push(endpoint.url, body, content_type, content_encoding)
+            except Exception as e:
+                print("[!] Spool error for", endpoint.name, e)
+        return DeliveryResult(endpoint, status, elapsed, drained, response_bytes, retries)
+
+    def post(self, payload: dict) -> List[DeliveryResult]:
+        """Deliver ``payload`` as JSON to all endpoints; results follow endpoint order."""
+        body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        return self.post_encoded(body, "application/json")
+
+    def post_encoded(
+        self,
+        body: bytes,
+        content_type: str,
+        content_encoding: Optional[str] = None,
+    ) -> List[DeliveryResult]:
+        """Deliver an already-serialised body, e.g. from firemark_batch.encode_batch."""
+        start = time.monotonic()
+        futures = [
+            self._executor.submit(
+                self._post_one, endpoint, body, content_type, content_encoding, start
+            )
+            for endpoint in self.endpoints
+        ]
+
+        results = []
+        for endpoint, future in zip(self.endpoints, futures):
+            remaining = endpoint.timeout_s - (time.monotonic() - start)
+            try:
+                results.append(future.result(timeout=max(remaining, 0.0) + RESULT_GRACE_S))
+            except Exception:
+                # Still running past its deadline; the worker spools the body
+                # itself once the request finally fails.
+                results.append(DeliveryResult(endpoint, "ERR", time.monotonic() - start))
+        for result in results:
+            self.stats.record(result)
+        return results
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False)
+        for session in self._sessions.values():
+            session.close()
+        if self.spool is not None:
+            self.spool.close()
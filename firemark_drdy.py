@@ -0,0 +1,185 @@
+"""Data-ready signalling for sensors, from a GPIO interrupt line or by polling.
+
+A sensor's DRDY/INT pin wired to a GPIO wakes waiters on the edge itself,
+through gpiozero or RPi.GPIO (whichever is installed). Without a wired pin,
+PollingDataReady calls the sensor's own ready check instead, sleeping until
+just before the next sample is expected from the intervals seen so far and
+only polling closely around that point.
+"""
+
+import importlib.util
+import threading
+from abc import ABC, abstractmethod
+import time
+from typing import Callable, List, Optional
+
+
+GPIOZERO_AVAILABLE = importlib.util.find_spec("gpiozero") is not None
+# find_spec of a submodule imports the parent, so check for the package first.
+RPIGPIO_AVAILABLE = (
+    importlib.util.find_spec("RPi") is not None
+    and importlib.util.find_spec("RPi.GPIO") is not None
+)
+
+if GPIOZERO_AVAILABLE:
+    from gpiozero import DigitalInputDevice
+
+if RPIGPIO_AVAILABLE:
+    import RPi.GPIO as RPiGPIO
+
+
+DEFAULT_MIN_POLL_S = 0.005
+DEFAULT_MAX_POLL_S = 1.0
+# Start polling this fraction of the learned interval after the last sample.
+EARLY_FRACTION = 0.9
+INTERVAL_ALPHA = 0.2
+
+
+class DataReady(ABC):
+    """Base for data-ready sources. ``wait()`` blocks until the sensor has data."""
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+        self._callbacks: List[Callable[[], None]] = []
+
+    @property
+    def interrupt(self) -> bool:
+        """True if callbacks fire from a hardware edge."""
+        return False
+
+    @abstractmethod
+    def is_ready(self) -> bool:
+        """True if the sensor has data now."""
+
+    def add_callback(self, callback: Callable[[], None]) -> None:
+        """Call ``callback`` from the GPIO thread on each data-ready edge."""
+        self._callbacks.append(callback)
+
+    def _fire(self, *_args) -> None:
+        self._event.set()
+        for callback in self._callbacks:
+            callback()
+
+    def wait(self, timeout_s: Optional[float] = None) -> bool:
+        """Block until data is ready or ``timeout_s`` passes; returns True if ready."""
+        self._event.clear()
+        # The line is level-held until the data is read, so an edge that came
+        # before the clear is still seen here.
+        if self.is_ready():
+            return True
+        return self._event.wait(timeout_s) or self.is_ready()
+
+    def close(self) -> None:
+        pass
+
+
+class GPIOZeroDataReady(DataReady):
+    def __init__(self, pin: int, active_high: bool = True) -> None:
+        super().__init__()
+        self._device = DigitalInputDevice(pin, pull_up=None, active_state=active_high)
+        self._device.when_activated = self._fire
+
+    @property
+    def interrupt(self) -> bool:
+        return True
+
+    def is_ready(self) -> bool:
+        return self._device.is_active
+
+    def close(self) -> None:
+        self._device.close()
+
+
+class RPIGPIODataReady(DataReady):
+    def __init__(self, pin: int, active_high: bool = True) -> None:
+        super().__init__()
+        self._pin = pin
+        self._active = RPiGPIO.HIGH if active_high else RPiGPIO.LOW
+        RPiGPIO.setwarnings(False)
+        RPiGPIO.setmode(RPiGPIO.BCM)
+        RPiGPIO.setup(pin, RPiGPIO.IN, pull_up_down=RPiGPIO.PUD_DOWN if active_high else RPiGPIO.PUD_UP)
+        RPiGPIO.add_event_detect(pin, RPiGPIO.RISING if active_high else RPiGPIO.FALLING, callback=self._fire)
+
+    @property
+    def interrupt(self) -> bool:
+        return True
+
+    def is_ready(self) -> bool:
+        return RPiGPIO.input(self._pin) == self._active
+
+    def close(self) -> None:
+        RPiGPIO.remove_event_detect(self._pin)
+
+
+class PollingDataReady(DataReady):
+    """Adaptive polling of ``ready`` for sensors with no interrupt line wired.
+
+    Intervals between ready samples are tracked with an EWMA, so after the
+    first few samples a wait sleeps straight to just before the next one is
+    due, then polls from ``min_poll_s``, backing off towards ``max_poll_s``.
+    """
+
+    def __init__(
+        self,
+        ready: Callable[[], bool],
+        min_poll_s: float = DEFAULT_MIN_POLL_S,
+        max_poll_s: float = DEFAULT_MAX_POLL_S,
+        interval_s: Optional[float] = None,
+    ) -> None:
+        super().__init__()
+        self._ready = ready
+        self.min_poll_s = min_poll_s
+        self.max_poll_s = max_poll_s
+        self.interval_s = interval_s
+        self.polls = 0
+        self._last_ready: Optional[float] = None
+
+    def is_ready(self) -> bool:
+        self.polls += 1
+        return self._ready()
+
+    def _seen(self, now: float) -> None:
+        if self._last_ready is not None:
+            interval = now - self._last_ready
+            if self.interval_s is None:
+                self.interval_s = interval
+            else:
+                self.interval_s += INTERVAL_ALPHA * (interval - self.interval_s)
+        self._last_ready = now
+
+    def wait(self, timeout_s: Optional[float] = None) -> bool:
+        start = time.monotonic()
+        deadline = None if timeout_s is None else start + timeout_s
+        if self._last_ready is not None and self.interval_s is not None:
+            wake = self._last_ready + self.interval_s * EARLY_FRACTION
+            if deadline is not None:
+                wake = min(wake, deadline)
+            if wake > start:
+                time.sleep(wake - start)
+
+        poll = self.min_poll_s
+        while True:
+            if self.is_ready():
+                self._seen(time.monotonic())
+                return True
+            now = time.monotonic()
+            if deadline is not None and now >= deadline:
+                return False
+            sleep = poll if deadline is None else min(poll, deadline - now)
+            time.sleep(sleep)
+            poll = min(poll * 2, self.max_poll_s)
+
+
+def build_data_ready(
+    pin: Optional[int],
+    ready: Callable[[], bool],
+    active_high: bool = True,
+    **polling_kwargs,
+) -> DataReady:
+    """An interrupt-driven source on ``pin`` if a GPIO backend is installed, else polling."""
+    if pin is not None:
+        if GPIOZERO_AVAILABLE:
+            return GPIOZeroDataReady(pin, active_high)
+        if RPIGPIO_AVAILABLE:
+            return RPIGPIODataReady(pin, active_high)
+    return PollingDataReady(ready, **polling_kwargs)
@@ -0,0 +1,145 @@
+"""Atomic, SD-card-friendly writer for the local latest.json dump."""
+
+import json
+import os
+import time
+from typing import Dict, Mapping, Optional, Sequence
+
+
+# Keys that change every cycle without the reading itself changing.
+DEFAULT_VOLATILE_KEYS = ("ts", "health", "delivery")
+# Absolute change that counts as a new value, by field name (the last part of
+# the dotted path) or full dotted path, e.g. "sensors.scd41.co2".
+DEFAULT_TOLERANCES = {
+    "temperature": 0.2,
+    "temp": 0.2,
+    "humidity": 1.0,
+    "pressure": 0.5,
+    "co2": 20,
+    "eco2": 20,
+    "tvoc": 10,
+}
+# Numeric fields without a tolerance count as changed beyond this fraction.
+DEFAULT_RELATIVE_TOLERANCE = 0.01
+DEFAULT_MAX_AGE_S = 600.0
+DEFAULT_FLUSH_INTERVAL_S = 300.0
+
+
+def _flatten(value: object, prefix: str, out: Dict[str, object]) -> None:
+    if isinstance(value, dict):
+        for key, child in value.items():
+            _flatten(child, f"{prefix}.{key}" if prefix else str(key), out)
+    else:
+        out[prefix] = value
+
+
+def write_atomic(path: str, data: bytes) -> None:
+    """Replace ``path`` with ``data`` so readers see the old or new file, never a partial one."""
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+class DumpWriter:
+    """Write the latest payload to ``path`` only when it is worth the wear.
+
+    A write is skipped unless the payload changed meaningfully since the last
+    one written, or the file is older than ``max_age_s``. Fields under
+    ``volatile_keys`` are ignored; numbers count as changed once they move by
+    more than their entry in ``tolerances`` (or ``relative_tolerance`` of the
+    written value), and anything else, or a field appearing or disappearing,
+    on any difference. With ``staging_path`` (e.g. on /dev/shm) every accepted
+    write lands on tmpfs, and ``path`` itself is rewritten every
+    ``flush_interval_s``, checked on every write() call, and on close().
+    """
+
+    def __init__(
+        self,
+        path: str,
+        volatile_keys: Sequence[str] = DEFAULT_VOLATILE_KEYS,
+        max_age_s: float = DEFAULT_MAX_AGE_S,
+        staging_path: Optional[str] = None,
+        flush_interval_s: float = DEFAULT_FLUSH_INTERVAL_S,
+        tolerances: Mapping[str, float] = DEFAULT_TOLERANCES,
+        relative_tolerance: float = DEFAULT_RELATIVE_TOLERANCE,
+    ) -> None:
+        self.path = path
+        self.volatile_keys = set(volatile_keys)
+        self.max_age_s = max_age_s
+        self.staging_path = staging_path
+        self.flush_interval_s = flush_interval_s
+        self.tolerances = dict(tolerances)
+        self.relative_tolerance = relative_tolerance
+        self._last_fields: Optional[Dict[str, object]] = None
+        self._last_write = 0.0
+        self._last_flush = 0.0
+        self._pending: Optional[bytes] = None
+        for target in (path, staging_path):
+            if target:
+                os.makedirs(os.path.dirname(target) or ".", exist_ok=True)
+
+    def _fields(self, data: dict) -> Dict[str, object]:
+        fields: Dict[str, object] = {}
+        for key, value in data.items():
+            if key not in self.volatile_keys:
+                _flatten(value, str(key), fields)
+        return fields
+
+    def _tolerance(self, name: str, written: float) -> float:
+        if name in self.tolerances:
+            return self.tolerances[name]
+        leaf = name.rsplit(".", 1)[-1]
+        if leaf in self.tolerances:
+            return self.tolerances[leaf]
+        return abs(written) * self.relative_tolerance
+
+    def _changed(self, fields: Dict[str, object]) -> bool:
+        last = self._last_fields
+        if last is None or fields.keys() != last.keys():
+            return True
+        for name, value in fields.items():
+            written = last[name]
+            numeric = (
+                isinstance(value, (int, float)) and isinstance(written, (int, float))
+                and not isinstance(value, bool) and not isinstance(written, bool)
+            )
+            if numeric:
+                if abs(value - written) > self._tolerance(name, written):
+                    return True
+            elif value != written:
+                return True
+        return False
+
+    def write(self, data: dict) -> bool:
+        """Returns True if the payload was written (to staging or to ``path``)."""
+        now = time.monotonic()
+        fields = self._fields(data)
+        if not self._changed(fields) and now - self._last_write < self.max_age_s:
+            if self._pending is not None and now - self._last_flush >= self.flush_interval_s:
+                self.flush()
+            return False
+
+        body = json.dumps(data, separators=(",", ":")).encode("utf-8")
+        if self.staging_path is None:
+            write_atomic(self.path, body)
+        else:
+            write_atomic(self.staging_path, body)
+            self._pending = body
+            if now - self._last_flush >= self.flush_interval_s:
+                self.flush()
+        self._last_fields = fields
+        self._last_write = now
+        return True
+
+    def flush(self) -> None:
+        """Copy the latest staged payload to persistent storage."""
+        if self._pending is not None:
+            write_atomic(self.path, self._pending)
+            self._pending = None
+        self._last_flush = time.monotonic()
+
+    def close(self) -> None:
+        self.flush()
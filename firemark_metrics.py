@@ -0,0 +1,145 @@
+"""Minimal in-memory metrics registry rendered in OpenMetrics text format.
+
+Metric families are declared once up front. Updates only touch the stored
+values and mark the family dirty; ``render()`` re-renders dirty families and
+otherwise hands back the cached exposition bytes, so a scrape costs a lookup.
+"""
+
+import math
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+
+def _format_value(value: float) -> str:
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+class Metric:
+    def __init__(
+        self,
+        name: str,
+        kind: str,
+        help_text: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = (),
+    ) -> None:
+        self.name = name
+        self.kind = kind
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        self._series: Dict[Tuple[str, ...], object] = {}
+        self._text = ""
+        self.dirty = True
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        return tuple(str(labels.get(n, "")) for n in self.labelnames)
+
+    def set(self, value: Optional[float], **labels: str) -> None:
+        """Set a gauge or counter; counters are set to their running total.
+
+        Setting None drops the series instead of exporting NaN.
+        """
+        if value is None:
+            self.remove(**labels)
+            return
+        key = self._key(labels)
+        if self._series.get(key) != value:
+            self._series[key] = value
+            self.dirty = True
+
+    def remove(self, **labels: str) -> None:
+        if self._series.pop(self._key(labels), None) is not None:
+            self.dirty = True
+
+    def set_histogram(self, counts: Sequence[int], total: float, count: int, **labels: str) -> None:
+        """Set cumulative bucket ``counts`` (one per bucket, excluding +Inf)."""
+        key = self._key(labels)
+        value = (tuple(counts), total, count)
+        if self._series.get(key) != value:
+            self._series[key] = value
+            self.dirty = True
+
+    def render(self) -> str:
+        if not self.dirty:
+            return self._text
+        lines: List[str] = [
+            f"# TYPE {self.name} {self.kind}",
+            f"# HELP {self.name} {self.help_text}",
+        ]
+        for key, value in sorted(self._series.items()):
+            if self.kind == "counter":
+                lines.append(f"{self.name}_total{_labels(self.labelnames, key)} {_format_value(value)}")
+            elif self.kind == "histogram":
+                counts, total, count = value
+                for bound, cumulative in zip(self.buckets, counts):
+                    le = f'le="{float(bound)!r}"'
+                    lines.append(f"{self.name}_bucket{_labels(self.labelnames, key, le)} {cumulative}")
+                inf = 'le="+Inf"'
+                lines.append(f"{self.name}_bucket{_labels(self.labelnames, key, inf)} {count}")
+                lines.append(f"{self.name}_count{_labels(self.labelnames, key)} {count}")
+                lines.append(f"{self.name}_sum{_labels(self.labelnames, key)} {_format_value(total)}")
+            else:
+                lines.append(f"{self.name}{_labels(self.labelnames, key)} {_format_value(value)}")
+        self._text = "\n".join(lines) + "\n"
+        self.dirty = False
+        return self._text
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._metrics: List[Metric] = []
+        self._lock = threading.Lock()
+        self._rendered = b"# EOF\n"
+
+    def _add(self, metric: Metric) -> Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def gauge(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> Metric:
+        return self._add(Metric(name, "gauge", help_text, labelnames))
+
+    def counter(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> Metric:
+        return self._add(Metric(name, "counter", help_text, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        buckets: Sequence[float],
+        labelnames: Sequence[str] = (),
+    ) -> Metric:
+        return self._add(Metric(name, "histogram", help_text, labelnames, buckets))
+
+    def render(self) -> bytes:
+        """Exposition text; only families changed since the last call are re-rendered."""
+        with self._lock:
+            if any(m.dirty for m in self._metrics):
+                text = "".join(m.render() for m in self._metrics) + "# EOF\n"
+                self._rendered = text.encode("utf-8")
+            return self._rendered
+
+    @property
+    def rendered(self) -> bytes:
+        """Last output of render(), without checking for changes."""
+        return self._rendered
@@ -0,0 +1,162 @@
+"""Per-sensor sampling scheduler feeding a shared latest-value table."""
+
+import heapq
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+from firemark_drdy import DataReady
+
+
+# How soon to look again when a sensor says it has nothing new yet,
+# as a fraction of its period.
+READY_RETRY_FRACTION = 0.1
+# A reading older than this many periods is reported as missing.
+STALE_PERIODS = 3.0
+
+
+@dataclass
+class SensorTask:
+    name: str
+    period_s: float
+    # Returns the reading dict, or None when there is nothing new to store.
+    read: Callable[[], Optional[dict]]
+    # Optional cheap check that new data is waiting (e.g. a data-ready flag).
+    ready: Optional[Callable[[], bool]] = None
+    stale_after_s: Optional[float] = None
+    # Optional interrupt-driven data-ready line; the task is sampled on each
+    # edge, and on its period only as a fallback for missed edges.
+    trigger: Optional[DataReady] = None
+
+    def __post_init__(self) -> None:
+        if self.stale_after_s is None:
+            self.stale_after_s = self.period_s * STALE_PERIODS
+
+
+class LatestTable:
+    """Thread-safe table holding the newest reading and status of each sensor."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._values: Dict[str, Tuple[Optional[dict], bool, float]] = {}
+        self._stale_after: Dict[str, float] = {}
+
+    def register(self, name: str, stale_after_s: float) -> None:
+        with self._lock:
+            self._stale_after[name] = stale_after_s
+            self._values.setdefault(name, (None, True, 0.0))
+
+    def update(self, name: str, value: Optional[dict], ok: bool) -> None:
+        with self._lock:
+            self._values[name] = (value, ok, time.monotonic())
+
+    def mark(self, name: str, ok: bool) -> None:
+        """Record the sensor's status without replacing its last reading."""
+        with self._lock:
+            value, _, updated = self._values.get(name, (None, True, 0.0))
+            self._values[name] = (value, ok, updated)
+
+    def get(self, name: str) -> Optional[dict]:
+        with self._lock:
+            entry = self._values.get(name)
+        return entry[0] if entry else None
+
+    def snapshot(self) -> Tuple[Dict[str, Optional[dict]], Dict[str, bool]]:
+        """Return ``(readings, status)``; stale readings come back as None."""
+        now = time.monotonic()
+        readings: Dict[str, Optional[dict]] = {}
+        status: Dict[str, bool] = {}
+        with self._lock:
+            for name, (value, ok, updated) in self._values.items():
+                fresh = now - updated <= self._stale_after.get(name, float("inf"))
+                readings[name] = value if fresh else None
+                status[name] = ok
+        return readings, status
+
+
+class SampleScheduler:
+    """Run each SensorTask on its own period from one background thread.
+
+    All sensors share one I2C bus, so reads are serialised on a single thread,
+    but each task keeps its own deadline on a heap: a slow or not-yet-ready
+    sensor only delays itself. Deadlines advance by whole periods from the
+    monotonic clock, so cadence does not drift. A task that was not ready on
+    time is re-phased to when its data did turn up, so polling follows the
+    sensor's own clock instead of missing it every cycle. Tasks with an
+    interrupt trigger are also sampled as soon as their line fires.
+    """
+
+    def __init__(self, tasks: List[SensorTask], table: LatestTable) -> None:
+        self.tasks = tasks
+        self.table = table
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._triggered: Deque[int] = deque()
+        self._thread: Optional[threading.Thread] = None
+        for idx, task in enumerate(tasks):
+            table.register(task.name, task.stale_after_s)
+            if task.trigger is not None and task.trigger.interrupt:
+                task.trigger.add_callback(lambda idx=idx: self._on_trigger(idx))
+
+    def _on_trigger(self, idx: int) -> None:
+        # Runs on the GPIO callback thread; the read itself stays on ours.
+        self._triggered.append(idx)
+        self._wake.set()
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self.run, name="firemark-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _sample(self, task: SensorTask) -> bool:
+        """Run one task; returns False if it was polled but not ready."""
+        try:
+            if task.ready is not None and not task.ready():
+                return False
+            value = task.read()
+            if value is None:
+                self.table.mark(task.name, True)
+            else:
+                self.table.update(task.name, value, True)
+        except Exception:
+            self.table.update(task.name, None, False)
+        return True
+
+    def run(self) -> None:
+        now = time.monotonic()
+        # (due, idx, retried): retried marks a deadline pushed back by a not-ready poll.
+        heap = [(now, idx, False) for idx in range(len(self.tasks))]
+        heapq.heapify(heap)
+
+        while not self._stop.is_set():
+            while self._triggered:
+                self._sample(self.tasks[self._triggered.popleft()])
+
+            due, idx, retried = heap[0]
+            delay = due - time.monotonic()
+            if delay > 0:
+                self._wake.wait(delay)
+                self._wake.clear()
+                continue
+            heapq.heappop(heap)
+            task = self.tasks[idx]
+
+            if not self._sample(task):
+                retry = time.monotonic() + task.period_s * READY_RETRY_FRACTION
+                heapq.heappush(heap, (retry, idx, True))
+                continue
+
+            now = time.monotonic()
+            # After a retry the data arrived between the last two polls; follow its phase.
+            next_due = (now if retried else due) + task.period_s
+            if next_due <= now:
+                # Fell more than a period behind: skip missed slots.
+                next_due = now + task.period_s
+            heapq.heappush(heap, (next_due, idx, False))
@@ -0,0 +1,164 @@
+"""Streaming smoke detection from the ADPD188BI blue and IR scatter channels.
+
+Each channel keeps an exponentially weighted mean and variance of its
+background (the chamber's own reflection), updated in O(1) per sample. While
+the signal is raised the mean only creeps towards it at a far smaller rate,
+so a smoke event is not learned as background but a lasting step (dust
+build-up, drift) is absorbed within the hour instead of latching the alarm.
+A sample counts as smoke when the blue rise is both large in absolute terms
+and several standard deviations above the background, and the IR/blue rise
+ratio is low: small smoke particles scatter the 470 nm blue light more than
+850 nm IR, while dust and water vapour scatter both about equally. Alarms
+are debounced over consecutive samples in both directions.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Optional
+
+
+DEFAULT_BASELINE_ALPHA = 0.002   # ~30 s time constant at 16 Hz
+DEFAULT_RAISED_ALPHA = 0.00004   # ~26 min time constant at 16 Hz
+DEFAULT_WARMUP_SAMPLES = 160
+DEFAULT_RISE_SIGMA = 6.0
+DEFAULT_MIN_RISE = 200
+DEFAULT_MAX_RATIO = 0.8
+DEFAULT_ON_SAMPLES = 8
+DEFAULT_OFF_SAMPLES = 32
+
+STATE_CLEAR = "clear"
+STATE_NUISANCE = "nuisance"   # Raised scatter with a dust/steam-like ratio
+STATE_SMOKE = "smoke"
+
+
+class Ewma:
+    """Exponentially weighted mean and variance, O(1) per update."""
+
+    __slots__ = ("alpha", "mean", "var", "count")
+
+    def __init__(self, alpha: float) -> None:
+        self.alpha = alpha
+        self.mean = 0.0
+        self.var = 0.0
+        self.count = 0
+
+    def update(self, x: float) -> None:
+        if self.count == 0:
+            self.mean = x
+        else:
+            diff = x - self.mean
+            incr = self.alpha * diff
+            self.mean += incr
+            self.var = (1.0 - self.alpha) * (self.var + diff * incr)
+        self.count += 1
+
+    def track(self, x: float, alpha: float) -> None:
+        """Move the mean towards ``x`` at ``alpha``, leaving the variance alone."""
+        self.mean += alpha * (x - self.mean)
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.var)
+
+
+@dataclass(frozen=True)
+class SmokeEvent:
+    state: str
+    previous: str
+    blue_rise: float
+    ir_rise: float
+    ratio: Optional[float]
+
+
+class SmokeDetector:
+    def __init__(
+        self,
+        baseline_alpha: float = DEFAULT_BASELINE_ALPHA,
+        raised_alpha: float = DEFAULT_RAISED_ALPHA,
+        warmup_samples: int = DEFAULT_WARMUP_SAMPLES,
+        rise_sigma: float = DEFAULT_RISE_SIGMA,
+        min_rise: float = DEFAULT_MIN_RISE,
+        max_ratio: float = DEFAULT_MAX_RATIO,
+        on_samples: int = DEFAULT_ON_SAMPLES,
+        off_samples: int = DEFAULT_OFF_SAMPLES,
+    ) -> None:
+        self.blue = Ewma(baseline_alpha)
+        self.ir = Ewma(baseline_alpha)
+        self.raised_alpha = raised_alpha
+        self.warmup_samples = warmup_samples
+        self.rise_sigma = rise_sigma
+        self.min_rise = min_rise
+        self.max_ratio = max_ratio
+        self.on_samples = on_samples
+        self.off_samples = off_samples
+
+        self.state = STATE_CLEAR
+        self.samples = 0
+        self.alarms = 0
+        self.last_blue = 0
+        self.last_ir = 0
+        self.last_ratio: Optional[float] = None
+        self._candidate = STATE_CLEAR
+        self._run = 0
+
+    @property
+    def warming_up(self) -> bool:
+        return self.samples < self.warmup_samples
+
+    def update(self, blue: int, ir: int) -> Optional[SmokeEvent]:
+        """Feed one blue/IR sample pair. Returns an event when the state changes."""
+        self.samples += 1
+        self.last_blue = blue
+        self.last_ir = ir
+        blue_rise = blue - self.blue.mean
+        ir_rise = ir - self.ir.mean
+
+        raised = (
+            not self.warming_up
+            and blue_rise > self.min_rise
+            and blue_rise > self.rise_sigma * self.blue.std
+        )
+        if not raised:
+            # Learn the background fully only from samples that look like background.
+            self.blue.update(blue)
+            self.ir.update(ir)
+            self.last_ratio = None
+            observed = STATE_CLEAR
+        else:
+            # Keep the variance of quiet samples: widening it by the rise would
+            # clear a lasting smoke event within a minute.
+            self.blue.track(blue, self.raised_alpha)
+            self.ir.track(ir, self.raised_alpha)
+            self.last_ratio = ir_rise / blue_rise
+            observed = STATE_SMOKE if self.last_ratio <= self.max_ratio else STATE_NUISANCE
+
+        if observed == self.state:
+            self._run = 0
+            return None
+        if observed != self._candidate:
+            self._candidate = observed
+            self._run = 0
+        self._run += 1
+        needed = self.off_samples if observed == STATE_CLEAR else self.on_samples
+        if self._run < needed:
+            return None
+
+        previous, self.state = self.state, observed
+        self._run = 0
+        if observed == STATE_SMOKE:
+            self.alarms += 1
+        return SmokeEvent(observed, previous, blue_rise, ir_rise, self.last_ratio)
+
+    def reading(self) -> dict:
+        """Current values for the collector payload."""
+        return {
+            "state": self.state,
+            "alarm": self.state == STATE_SMOKE,
+            "alarms": self.alarms,
+            "blue": self.last_blue,
+            "ir": self.last_ir,
+            "blue_baseline": round(self.blue.mean, 1),
+            "ir_baseline": round(self.ir.mean, 1),
+            "ratio": None if self.last_ratio is None else round(self.last_ratio, 3),
+            "warming_up": self.warming_up,
+        }
@@ -0,0 +1,179 @@
+"""Crash-safe store-and-forward spool for payloads an endpoint did not accept."""
+
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS spool (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    endpoint TEXT NOT NULL,
+    created REAL NOT NULL,
+    content_type TEXT NOT NULL,
+    body BLOB NOT NULL,
+    content_encoding TEXT
+);
+CREATE INDEX IF NOT EXISTS spool_endpoint_id ON spool (endpoint, id);
+CREATE TABLE IF NOT EXISTS spool_dead (
+    id INTEGER PRIMARY KEY,
+    endpoint TEXT NOT NULL,
+    created REAL NOT NULL,
+    content_type TEXT NOT NULL,
+    body BLOB NOT NULL,
+    content_encoding TEXT,
+    status INTEGER NOT NULL,
+    rejected REAL NOT NULL
+);
+"""
+
+
+@dataclass
+class SpooledPayload:
+    id: int
+    endpoint: str
+    created: float
+    content_type: str
+    body: bytes
+    content_encoding: Optional[str] = None
+
+
+class PayloadSpool:
+    """Append-only SQLite (WAL) queue of undelivered request bodies.
+
+    Rows are keyed per endpoint, so a host that was down only receives what it
+    missed. Rows an endpoint rejects outright are moved to a dead-letter table
+    rather than deleted. Total body size of both is capped at ``max_bytes``;
+    when the cap is hit dead letters go first, then the oldest queued rows
+    across all endpoints.
+    """
+
+    def __init__(self, path: str, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+        self._size = sum(
+            self._db.execute(f"SELECT COALESCE(SUM(LENGTH(body)), 0) FROM {table}").fetchone()[0]
+            for table in ("spool", "spool_dead")
+        )
+
+    def push(
+        self,
+        endpoint: str,
+        body: bytes,
+        content_type: str,
+        content_encoding: Optional[str] = None,
+    ) -> None:
+        with self._lock:
+            self._db.execute(
+                "INSERT INTO spool (endpoint, created, content_type, body, content_encoding) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (endpoint, time.time(), content_type, sqlite3.Binary(body), content_encoding),
+            )
+            self._size += len(body)
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        # Called with the lock held.
+        self._db.execute("BEGIN")
+        try:
+            for table in ("spool_dead", "spool"):
+                while self._size > self.max_bytes:
+                    rows = self._db.execute(
+                        f"SELECT id, LENGTH(body) FROM {table} ORDER BY id LIMIT 64"
+                    ).fetchall()
+                    if not rows:
+                        break
+                    for row_id, size in rows:
+                        if self._size <= self.max_bytes:
+                            break
+                        self._db.execute(f"DELETE FROM {table} WHERE id = ?", (row_id,))
+                        self._size -= size
+            if self._size > self.max_bytes:
+                self._size = 0
+            self._db.execute("COMMIT")
+        except Exception:
+            self._db.execute("ROLLBACK")
+            raise
+
+    def peek(self, endpoint: str, limit: int) -> List[SpooledPayload]:
+        """Return up to ``limit`` of the oldest bodies queued for ``endpoint``."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT id, endpoint, created, content_type, body, content_encoding FROM spool "
+                "WHERE endpoint = ? ORDER BY id LIMIT ?",
+                (endpoint, limit),
+            ).fetchall()
+        return [SpooledPayload(r[0], r[1], r[2], r[3], bytes(r[4]), r[5]) for r in rows]
+
+    def ack(self, ids: Sequence[int]) -> None:
+        """Drop delivered rows in a single transaction."""
+        if not ids:
+            return
+        with self._lock:
+            self._db.execute("BEGIN")
+            try:
+                freed = 0
+                for row_id in ids:
+                    row = self._db.execute(
+                        "SELECT LENGTH(body) FROM spool WHERE id = ?", (row_id,)
+                    ).fetchone()
+                    if row is None:
+                        continue
+                    self._db.execute("DELETE FROM spool WHERE id = ?", (row_id,))
+                    freed += row[0]
+                self._db.execute("COMMIT")
+            except Exception:
+                self._db.execute("ROLLBACK")
+                raise
+            self._size -= freed
+
+    def reject(self, ids: Sequence[int], status: int) -> None:
+        """Move rows the endpoint refused with ``status`` to the dead-letter table."""
+        if not ids:
+            return
+        with self._lock:
+            self._db.execute("BEGIN")
+            try:
+                now = time.time()
+                for row_id in ids:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO spool_dead "
+                        "SELECT id, endpoint, created, content_type, body, content_encoding, ?, ? "
+                        "FROM spool WHERE id = ?",
+                        (status, now, row_id),
+                    )
+                    self._db.execute("DELETE FROM spool WHERE id = ?", (row_id,))
+                self._db.execute("COMMIT")
+            except Exception:
+                self._db.execute("ROLLBACK")
+                raise
+
+    def rejected(self, endpoint: str) -> int:
+        with self._lock:
+            return self._db.execute(
+                "SELECT COUNT(*) FROM spool_dead WHERE endpoint = ?", (endpoint,)
+            ).fetchone()[0]
+
+    def pending(self, endpoint: str) -> int:
+        with self._lock:
+            return self._db.execute(
+                "SELECT COUNT(*) FROM spool WHERE endpoint = ?", (endpoint,)
+            ).fetchone()[0]
+
+    @property
+    def size_bytes(self) -> int:
+        return self._size
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
@@ -0,0 +1,132 @@
+"""System health readings for the Firemark scripts, without spawning processes.
+
+Values come straight from sysfs/procfs plus an in-process TCP probe, and each
+one is cached for its own TTL so callers can ask as often as they like.
+"""
+
+import functools
+import socket
+import time
+from typing import Callable, Optional
+
+
+THERMAL_PATH = "/sys/class/thermal/thermal_zone0/temp"
+WIRELESS_PATH = "/proc/net/wireless"
+UPTIME_PATH = "/proc/uptime"
+THROTTLED_PATH = "/sys/devices/platform/soc/soc:firmware/get_throttled"
+
+WIRELESS_INTERFACE = "wlan0"
+LATENCY_HOST = "ferrix.local"
+LATENCY_PORT = 5000
+LATENCY_TIMEOUT_S = 1.0
+
+# Set once THROTTLED_PATH turns out not to exist; it will not appear later.
+_throttled_missing = False
+
+
+def ttl_cache(ttl_s: float) -> Callable:
+    """Cache a zero-argument function's result for ``ttl_s`` seconds."""
+    def decorator(fn: Callable) -> Callable:
+        state = {"at": None, "value": None}
+
+        @functools.wraps(fn)
+        def wrapper():
+            now = time.monotonic()
+            if state["at"] is None or now - state["at"] >= ttl_s:
+                state["value"] = fn()
+                state["at"] = now
+            return state["value"]
+
+        wrapper.cache_clear = lambda: state.update(at=None)
+        return wrapper
+    return decorator
+
+
+@ttl_cache(5.0)
+def cpu_temp() -> Optional[float]:
+    try:
+        with open(THERMAL_PATH, "r") as f:
+            return round(int(f.read().strip()) / 1000.0, 1)
+    except Exception:
+        return None
+
+
+@ttl_cache(1.0)
+def uptime() -> Optional[float]:
+    try:
+        with open(UPTIME_PATH, "r") as f:
+            return float(f.readline().split()[0])
+    except Exception:
+        return None
+
+
+@ttl_cache(5.0)
+def rssi() -> Optional[int]:
+    # /proc/net/wireless: "wlan0: 0000   70.  -40.  -256 ..." (link, level, noise)
+    try:
+        with open(WIRELESS_PATH, "r") as f:
+            for line in f:
+                name, _, rest = line.partition(":")
+                if name.strip() == WIRELESS_INTERFACE:
+                    return int(float(rest.split()[2]))
+    except Exception:
+        pass
+    return None
+
+
+@ttl_cache(300.0)
+def _latency_target():
+    return socket.getaddrinfo(LATENCY_HOST, LATENCY_PORT, type=socket.SOCK_STREAM)[0]
+
+
+@ttl_cache(30.0)
+def latency_ms() -> Optional[float]:
+    """Round trip of a TCP connect to the ingest server (no root needed, unlike ICMP)."""
+    try:
+        family, socktype, proto, _, addr = _latency_target()
+    except Exception:
+        _latency_target.cache_clear()
+        return None
+    try:
+        with socket.socket(family, socktype, proto) as sock:
+            sock.settimeout(LATENCY_TIMEOUT_S)
+            start = time.perf_counter()
+            sock.connect(addr)
+            return round((time.perf_counter() - start) * 1000.0, 1)
+    except Exception:
+        return None
+
+
+@ttl_cache(30.0)
+def throttled() -> Optional[str]:
+    # Older kernels lack the sysfs node. Running vcgencmd instead would spawn
+    # a process per refresh, so the reading is simply unavailable there.
+    global _throttled_missing
+    if _throttled_missing:
+        return None
+    try:
+        with open(THROTTLED_PATH, "r") as f:
+            return f"0x{int(f.read().strip(), 16):x}"
+    except FileNotFoundError:
+        _throttled_missing = True
+        return None
+    except Exception:
+        return None
+
+
+@ttl_cache(300.0)
+def ip_address() -> str:
+    try:
+        return socket.gethostbyname(socket.gethostname())
+    except Exception:
+        return "unknown"
+
+
+def collect_health() -> dict:
+    return {
+        "cpu_temp": cpu_temp(),
+        "uptime": uptime(),
+        "rssi": rssi(),
+        "latency_ms": latency_ms(),
+        "throttled": throttled(),
+    }
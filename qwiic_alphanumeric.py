@@ -54,14 +54,80 @@ New to qwiic? Take a look at the entire [SparkFun Qwiic Ecosystem](https://www.s
 """
 # ---------------------------------------------------------------------------------
 
+import importlib.util
 import time
-import qwiic_i2c
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# qwiic_i2c is only needed to open a real bus. Any object with the same methods, such
+# as qwiic_alphanumeric_mock.MockI2CBus, can be passed in as i2c_driver instead.
+_QWIIC_I2C_AVAILABLE = importlib.util.find_spec("qwiic_i2c") is not None
+
+if _QWIIC_I2C_AVAILABLE:
+    import qwiic_i2c
 
 _DEFAULT_NAME = "Qwiic Alphanumeric"
 
 _QWIIC_ALPHANUMERIC_DEFAULT_ADDRESS = 0x70
 _AVAILABLE_I2C_ADDRESS = [_QWIIC_ALPHANUMERIC_DEFAULT_ADDRESS, 0x71, 0x72, 0x73]
 
+# ---------------------------------------------------------------------------------
+# _segment_ram_bit(segment, slot)
+#
+# Holtek RAM location of one segment of one digit slot (0-3) within a display
+def _segment_ram_bit(segment, slot):
+    """!
+    Work out where a segment lives in a display's 16 byte Holtek RAM image.
+    This is the address math of illuminate_segment(), done once per segment.
+
+    @param segment: segment number, 0 for 'A' through 13 for 'N'
+    @param slot: digit position within the display, 0 to 3
+
+    @return **tuple** (RAM byte offset within the display, bit mask)
+    """
+    com = segment
+    if com > 6:
+        com = com - 7
+    # Special cases in which the segment order is a lil switched.
+    if segment == 8:    # 'I'
+        com = 0
+    if segment == 7:    # 'H'
+        com = 1
+
+    row = slot
+    if segment > 6:
+        row = row + 4
+
+    adr = com * 2
+    if row > 7:
+        adr = adr + 1
+        row = row - 8
+
+    return (adr, 1 << row)
+
+# ---------------------------------------------------------------------------------
+# _glyph_ram(segments_to_turn_on)
+#
+# RAM contributions of a whole set of segments, for each of the four digit slots
+def _glyph_ram(segments_to_turn_on):
+    """!
+    Precompute the RAM writes for a set of segments in every digit slot.
+
+    @param segments_to_turn_on: 14 bit segment mask (bit 0 is segment A)
+
+    @return **tuple** One entry per digit slot, each a tuple of
+        (RAM byte offset within the display, bit mask) pairs, one per byte touched.
+    """
+    slots = []
+    for slot in range(0, 4):
+        masks = {}
+        for segment in range(0, 14):
+            if (segments_to_turn_on >> segment) & 0b1:
+                adr, bit = _segment_ram_bit(segment, slot)
+                masks[adr] = masks.get(adr, 0) | bit
+        slots.append(tuple(sorted(masks.items())))
+    return tuple(slots)
+
 class QwiicAlphanumeric(object):
     """!
     QwiicAlphanumeric
@@ -73,6 +139,14 @@ class QwiicAlphanumeric(object):
 
     @return  The 
     """
+    # Per-instance state lives in slots, so two instances never share a buffer
+    __slots__ = ('address', '_i2c',
+                 '_device_address_display_one', '_device_address_display_two',
+                 '_device_address_display_three', '_device_address_display_four',
+                 'digit_position', 'number_of_displays', 'display_on_off', 'decimal_on_off',
+                 'colon_on_off', 'blink_rate', 'display_RAM', '_RAM_view', 'display_content',
+                 '_shadow_RAM', '_offline', '_reconnect_callback', '_sent', 'populated_rows_only')
+
     # Constructor
     device_name = _DEFAULT_NAME
     available_addresses = _AVAILABLE_I2C_ADDRESS
@@ -120,6 +194,14 @@ class QwiicAlphanumeric(object):
 
     SFE_ALPHANUM_UNKNOWN_CHAR = 95
 
+    # The 14 segment layout only uses COM0-COM6 rows 0-8: RAM bytes 0 to 12. Row 8 of
+    # COM0 and COM1 (bytes 1 and 3) holds the colon and decimal point.
+    ALPHA_RAM_POPULATED_BYTES = 13
+
+    # Reconnect backoff for displays that stop responding, in seconds
+    RECONNECT_BACKOFF_MIN = 0.1
+    RECONNECT_BACKOFF_MAX = 30.0
+
     # Lookup table of segments for various characters
     alphanumeric_segs = []
     # nmlkjihgfedcba
@@ -220,23 +302,50 @@ class QwiicAlphanumeric(object):
     alphanumeric_segs.append(0b00000101010010)  # '~'
     alphanumeric_segs.append(0b11111111111111)  # Unknown character (DEL or RUBOUT)
 
-    # Globals
-    _device_address_display_one = 0    # Address of primary alphanumeric display
-    _device_address_display_two = 0
-    _device_address_display_three = 0
-    _device_address_display_four = 0
-    digit_position = 0  # Tracks the position of the current digit
-    number_of_displays = 1 # Tracks the number of displays connected to the I2C bus, default is one display
-    display_on_off = 0  # Tracks the on/off state of the display
-    decimal_on_off = 0  # Tracks the on/off state of the decimal segment
-    colon_on_off = 0    # Tracks the on/off state of the colon segment
-    blink_rate = ALPHA_BLINK_RATE_NOBLINK   # Tracks the current blinking status
-
-    display_RAM = [0] * 16 * 4
-    display_content = [' '] * (4 * 4 + 1)
+    # Precomputed at import: character -> per digit slot RAM (offset, mask) pairs.
+    # Index 0 is ' ', then '!' through '~'. Anything else renders as the unknown glyph.
+    _char_ram = {}
+    for _i, _segs in enumerate(alphanumeric_segs[:SFE_ALPHANUM_UNKNOWN_CHAR]):
+        _char_ram[' ' if _i == 0 else chr(ord('!') + _i - 1)] = _glyph_ram(_segs)
+    _unknown_ram = _glyph_ram(alphanumeric_segs[SFE_ALPHANUM_UNKNOWN_CHAR])
+    # Segment mask -> per digit slot RAM pairs, for illuminate_char()
+    _segs_ram = {}
+    for _segs in alphanumeric_segs:
+        _segs_ram[_segs] = _glyph_ram(_segs)
+    del _i, _segs
 
     def __init__(self, address=None, i2c_driver=None):
 
+        self._device_address_display_one = 0    # Address of primary alphanumeric display
+        self._device_address_display_two = 0
+        self._device_address_display_three = 0
+        self._device_address_display_four = 0
+        self.digit_position = 0  # Tracks the position of the current digit
+        self.number_of_displays = 1 # Tracks the number of displays connected to the I2C bus, default is one display
+        self.display_on_off = 0  # Tracks the on/off state of the display
+        self.decimal_on_off = 0  # Tracks the on/off state of the decimal segment
+        self.colon_on_off = 0    # Tracks the on/off state of the colon segment
+        self.blink_rate = self.ALPHA_BLINK_RATE_NOBLINK   # Tracks the current blinking status
+
+        # Holtek RAM images of all four displays, 16 bytes each. update_display() hands
+        # slices of the memoryview to the I2C driver, so nothing is copied on the way out.
+        self.display_RAM = bytearray(16 * 4)
+        self._RAM_view = memoryview(self.display_RAM)
+        self.display_content = [' '] * (4 * 4 + 1)
+
+        # Write only RAM bytes 0-12, which hold every segment, colon and decimal point,
+        # instead of the whole 16 byte image. Saves 3 bytes a display on a full write.
+        self.populated_rows_only = False
+
+        # What each display's RAM currently holds, as last written. None means unknown,
+        # which forces a full write on the next update.
+        self._shadow_RAM = [None] * 4
+
+        # Connection health: address -> (consecutive failures, monotonic time of next probe)
+        self._offline = {}
+        self._reconnect_callback = None
+        self._sent = {}     # address -> {command kind: last command byte it accepted}
+
         # Did the user specify an I2C address?
         if address in self.available_addresses:
             self.address = address
@@ -245,7 +354,7 @@ class QwiicAlphanumeric(object):
 
         # Load the I2C driver if one isn't provided
         if i2c_driver == None:
-            self._i2c = qwiic_i2c.getI2CDriver()
+            self._i2c = qwiic_i2c.getI2CDriver() if _QWIIC_I2C_AVAILABLE else None
             if self._i2c == None:
                 print("Unable to load I2C driver for this platform.")
                 return
@@ -290,6 +399,10 @@ class QwiicAlphanumeric(object):
             if self.is_connected(i) == False:
                 return False
             time.sleep(0.01)
+
+        # Display contents are unknown until written once
+        self._shadow_RAM = [None] * 4
+        self._offline = {}
         
         if self.initialize() == False:
             return False
@@ -298,6 +411,8 @@ class QwiicAlphanumeric(object):
             return False
         
         self.display_content[4 * 4] = '\0'  # Terminate the array because we are doing direct prints
+
+        return True
     
     # ---------------------------------------------------------------------------------
     # is_connected(display_number)
@@ -315,7 +430,7 @@ class QwiicAlphanumeric(object):
         
         # The LED driver IC sometimes fails to respond. This attempts multiple times before giving up.
         for x in range(0, tries_before_giveup):
-            if self._i2c.isDeviceConnected(self.look_up_display_address(display_number)) == True:
+            if self._probe(self.look_up_display_address(display_number)) == True:
                 return True
             time.sleep(0.01)
         return False
@@ -332,23 +447,11 @@ class QwiicAlphanumeric(object):
 
         @return **bool** True if all function calls passed, False if there's a failure somewhere
         """
-        # Turn on system clock of all displays
-        if self.enable_system_clock() == False:
-            return False
-        
-        # Set brightness of all displays to full brightness
-        if self.set_brightness(15) == False:
-            return False
+        # Forget what the displays were told before, so every setting is sent
+        self._sent = {}
 
-        # Turn blinking off for all displays
-        if self.set_blink_rate(self.ALPHA_BLINK_RATE_NOBLINK) == False:
-            return False
-        
-        # Turn on all displays
-        if self.display_on() == False:
-            return False
-        
-        return True
+        # Clocks on, full brightness, no blinking, displays on: three commands per display
+        return self.apply_settings(brightness = 15, blink_rate = 0, display_on = True, system_clock = True)
     
     # ---------------------------------------------------------------------------------
     # enable_system_clock()
@@ -360,13 +463,7 @@ class QwiicAlphanumeric(object):
 
         @return **bool** True if all clocks successfully enabled, false otherwise.
         """
-        status = True
-        
-        for i in range(1, self.number_of_displays + 1):
-            if self.enable_system_clock_single(i) == False:
-                status = False
-        
-        return status
+        return self.apply_settings(system_clock = True)
 
     # ---------------------------------------------------------------------------------
     # disable_system_clock()
@@ -378,14 +475,8 @@ class QwiicAlphanumeric(object):
 
         @return **bool** True if all clocks successfully disabled, false otherwise.
         """
-        status = True
+        return self.apply_settings(system_clock = False)
 
-        for i in range(1, self.number_of_displays + 1):
-            if self.disable_system_clock_single(i) == False:
-                status = False
-        
-        return status
-    
     # ---------------------------------------------------------------------------------
     # enable_system_clock_single(display_number)
     #
@@ -399,12 +490,7 @@ class QwiicAlphanumeric(object):
 
         @return **bool** True if setting updated successfully, false otherwise.
         """
-        data_to_write = self.ALPHA_CMD_SYSTEM_SETUP | 1 # Enable system clock  bit
-
-        status = self.write_RAM_byte(self.look_up_display_address(display_number), data_to_write)
-        time.sleep(0.001)   # Allow display to start
-
-        return status
+        return self.apply_settings(system_clock = True, displays = [display_number])
 
     # ---------------------------------------------------------------------------------
     # disable_system_clock_single(display_number)
@@ -419,9 +505,7 @@ class QwiicAlphanumeric(object):
 
         @return **bool** True if setting updated successfully, false otherwise.
         """
-        data_to_write = self.ALPHA_CMD_SYSTEM_SETUP | 0 # Standby mode
-
-        return self.write_RAM(self.look_up_display_address(display_number), data_to_write)
+        return self.apply_settings(system_clock = False, displays = [display_number])
 
     # ---------------------------------------------------------------------------------
     # look_up_display_address(display_number)
@@ -466,6 +550,99 @@ class QwiicAlphanumeric(object):
 
         return self.update_display()
 
+    # ---------------------------------------------------------------------------------
+    # apply_settings(brightness, blink_rate, display_on, system_clock, displays)
+    #
+    # Change any mix of display settings in one transaction
+    def apply_settings(self, brightness = None, blink_rate = None, display_on = None, system_clock = None, displays = None):
+        """!
+        Change any mix of settings on some or all displays in one go. The final
+        command for every display is worked out first and compared with the last one
+        that display accepted, so settings that would not change anything are not
+        sent at all, and blink rate and on/off share one display setup command.
+        The HT16K33 has no broadcast address, so each command left is one I2C write.
+
+        @param brightness: duty over 16, 0 (1/16 brightness) to 15 (full), or None to keep
+        @param blink_rate: 2.0, 1.0 or 0.5 Hz, any other number for no blink, or None to keep
+        @param display_on: True to turn displays on, False to turn them off, or None to keep
+        @param system_clock: True to run the oscillator, False for standby, or None to keep
+        @param displays: list of display numbers to change, all displays by default
+
+        @return **bool** True if every command sent was accepted, false otherwise.
+        """
+        if displays is None:
+            displays = range(1, self.number_of_displays + 1)
+
+        if blink_rate is not None:
+            blink_rate = self._blink_bits(blink_rate)
+        if display_on is not None:
+            display_on = self.ALPHA_DISPLAY_ON if display_on else self.ALPHA_DISPLAY_OFF
+
+        clock_commands = []
+        commands = []
+        for i in displays:
+            address = self.look_up_display_address(i)
+            sent = self._sent.get(address, {})
+
+            if system_clock is not None:
+                command = self.ALPHA_CMD_SYSTEM_SETUP | (1 if system_clock else 0)
+                if sent.get(self.ALPHA_CMD_SYSTEM_SETUP) != command:
+                    clock_commands.append((address, command))
+
+            if brightness is not None:
+                command = self.ALPHA_CMD_DIMMING_SETUP | min(max(brightness, 0), 15)
+                if sent.get(self.ALPHA_CMD_DIMMING_SETUP) != command:
+                    commands.append((address, command))
+
+            if blink_rate is not None or display_on is not None:
+                # Keep whichever half of this display's setup byte is not being changed
+                current = sent.get(self.ALPHA_CMD_DISPLAY_SETUP,
+                                   self.ALPHA_CMD_DISPLAY_SETUP | (self.blink_rate << 1) | self.display_on_off)
+                new_blink = blink_rate if blink_rate is not None else (current >> 1) & 0b11
+                new_on = display_on if display_on is not None else current & 0b1
+                command = self.ALPHA_CMD_DISPLAY_SETUP | (new_blink << 1) | new_on
+                if sent.get(self.ALPHA_CMD_DISPLAY_SETUP) != command:
+                    commands.append((address, command))
+
+        status = self._send_commands(clock_commands)
+        if system_clock and len(clock_commands) > 0:
+            time.sleep(0.001)   # Allow displays to start
+
+        if self._send_commands(commands) == False:
+            status = False
+
+        if blink_rate is not None:
+            self.blink_rate = blink_rate
+        if display_on is not None:
+            self.display_on_off = display_on
+
+        return status
+
+    # ---------------------------------------------------------------------------------
+    # _blink_bits(rate)
+    #
+    # Convert a blink frequency in Hz to the display setup blink bits
+    def _blink_bits(self, rate):
+        if rate == 2.0:
+            return self.ALPHA_BLINK_RATE_2HZ
+        elif rate == 1.0:
+            return self.ALPHA_BLINK_RATE_1HZ
+        elif rate == 0.5:
+            return self.ALPHA_BLINK_RATE_0_5HZ
+        # Default to no blink
+        return self.ALPHA_BLINK_RATE_NOBLINK
+
+    # ---------------------------------------------------------------------------------
+    # _send_commands(commands)
+    #
+    # Write a list of (address, command) pairs
+    def _send_commands(self, commands):
+        status = True
+        for address, command in commands:
+            if self.write_RAM_byte(address, command) == False:
+                status = False
+        return status
+
     # ---------------------------------------------------------------------------------
     # set_brightness(duty)
     # 
@@ -479,13 +656,7 @@ class QwiicAlphanumeric(object):
 
         @return **bool** True if brightness is successfully updated, false otherwise.
         """
-        status = True
-
-        for i in range(1, self.number_of_displays + 1):
-            if self.set_brightness_single(i, duty) == False:
-                status = False
-        
-        return status
+        return self.apply_settings(brightness = duty)
 
     # ---------------------------------------------------------------------------------
     # set_brightness_single(display_number, duty)
@@ -500,14 +671,7 @@ class QwiicAlphanumeric(object):
 
         @return **bool** True if brightness is successfully updated, false otherwise.
         """
-        # Error check
-        if duty > 15:
-            duty = 15
-        elif duty < 0:
-            duty = 0
-        
-        data_to_write = self.ALPHA_CMD_DIMMING_SETUP | duty
-        return self.write_RAM_byte(self.look_up_display_address(display_number), data_to_write)
+        return self.apply_settings(brightness = duty, displays = [display_number])
 
     # ---------------------------------------------------------------------------------
     # set_blink_rate(rate)
@@ -523,14 +687,8 @@ class QwiicAlphanumeric(object):
 
         @return **bool** True if blink setting is successfully updated, false otherwise.
         """
-        status = True
+        return self.apply_settings(blink_rate = rate)
 
-        for i in range(1, self.number_of_displays + 1):
-            if self.set_blink_rate_single(i, rate) == False:
-                status = False
-        
-        return status
-    
     # ---------------------------------------------------------------------------------
     # set_blink_rate_single(display_number, rate)
     #
@@ -546,18 +704,7 @@ class QwiicAlphanumeric(object):
 
         @return **bool** True if blink setting is successfully updated, false otherwise.
         """
-        if rate == 2.0:
-            blink_rate = self.ALPHA_BLINK_RATE_2HZ
-        elif rate == 1.0:
-            blink_rate = self.ALPHA_BLINK_RATE_1HZ
-        elif rate == 0.5:
-            blink_rate = self.ALPHA_BLINK_RATE_0_5HZ
-        # Default to no blink
-        else:
-            blink_rate = self.ALPHA_BLINK_RATE_NOBLINK
-        
-        data_to_write = self.ALPHA_CMD_DISPLAY_SETUP | (blink_rate << 1) | self.display_on_off
-        return self.write_RAM_byte(self.look_up_display_address(display_number), data_to_write)
+        return self.apply_settings(blink_rate = rate, displays = [display_number])
     
     # ---------------------------------------------------------------------------------
     # display_on_single(display_number)
@@ -601,13 +748,7 @@ class QwiicAlphanumeric(object):
 
         @return **bool** True if display is successfully updated, false otherwise.
         """
-        if turn_on_display:
-            self.display_on_off = self.ALPHA_DISPLAY_ON
-        else:
-            self.display_on_off = self.ALPHA_DISPLAY_OFF
-        
-        data_to_write = self.ALPHA_CMD_DISPLAY_SETUP | (self.blink_rate << 1) | self.display_on_off
-        return self.write_RAM_byte(self.look_up_display_address(display_number), data_to_write)
+        return self.apply_settings(display_on = bool(turn_on_display), displays = [display_number])
     
     # ---------------------------------------------------------------------------------
     # display_on()
@@ -619,16 +760,8 @@ class QwiicAlphanumeric(object):
 
         @return **bool** True if displays are successfully turned on, false otherwise.
         """
-        status = True
-
-        self.display_on_off = self.ALPHA_DISPLAY_ON
+        return self.apply_settings(display_on = True)
 
-        for i in range(1, self.number_of_displays + 1):
-            if self.display_on_single(i) == False:
-                status = False
-        
-        return status
-    
     # ---------------------------------------------------------------------------------
     # display_off()
     #
@@ -639,16 +772,8 @@ class QwiicAlphanumeric(object):
 
         @return **bool** True if all displays are successfully turned off, false otherwise.
         """
-        status = True
+        return self.apply_settings(display_on = False)
 
-        self.display_on_off = self.ALPHA_DISPLAY_OFF
-
-        for i in range(1, self.number_of_displays + 1):
-            if self.display_off_single(i) == False:
-                status = False
-        
-        return status
-    
     # ---------------------------------------------------------------------------------
     # decimal_on_single(display_number)
     #
@@ -691,6 +816,14 @@ class QwiicAlphanumeric(object):
 
         @return **bool** true if the display is updated successfully, false otherwise.
         """
+        self._set_decimal_bit(display_number, turn_on_decimal)
+        return self.update_display()
+
+    # ---------------------------------------------------------------------------------
+    # _set_decimal_bit(display_number, turn_on_decimal)
+    #
+    # Set or clear the decimal bit in display_RAM without pushing it to the display
+    def _set_decimal_bit(self, display_number, turn_on_decimal):
         adr = 0x03
         dat = 0
 
@@ -703,7 +836,6 @@ class QwiicAlphanumeric(object):
         
         self.display_RAM[adr + (display_number - 1) * 16] &= 0xFE
         self.display_RAM[adr + (display_number - 1) * 16] |= dat
-        return self.update_display()
     
     # ---------------------------------------------------------------------------------
     # decimal_on()
@@ -785,6 +917,14 @@ class QwiicAlphanumeric(object):
         @param turn_on_colon: boolean variable. If true, colon will turn on.
             If false, colon will turn off.
         """
+        self._set_colon_bit(display_number, turn_on_colon)
+        return self.update_display()
+
+    # ---------------------------------------------------------------------------------
+    # _set_colon_bit(display_number, turn_on_colon)
+    #
+    # Set or clear the colon bit in display_RAM without pushing it to the display
+    def _set_colon_bit(self, display_number, turn_on_colon):
         adr = 0x01
         dat = 0
 
@@ -797,7 +937,6 @@ class QwiicAlphanumeric(object):
         
         self.display_RAM[adr + (display_number - 1) * 16] &= 0xFE
         self.display_RAM[adr + (display_number - 1) * 16] |= dat
-        return self.update_display()
 
     # ---------------------------------------------------------------------------------
     # colon_on()
@@ -898,12 +1037,14 @@ class QwiicAlphanumeric(object):
 
         @return **Void** nothing
         """
-        for i in range(0, 14):
-            if (segments_to_turn_on >> i) & 0b1:
-                temp_char = ord('A') + i
-                temp_char = chr(temp_char)
-                self.illuminate_segment(temp_char, digit) # Convert the segment number to a letter
-        
+        glyph = self._segs_ram.get(segments_to_turn_on)
+        if glyph is None:
+            glyph = _glyph_ram(segments_to_turn_on)
+
+        offset = int(digit / 4) * 16
+        for adr, mask in glyph[digit % 4]:
+            self.display_RAM[offset + adr] |= mask
+
     # ---------------------------------------------------------------------------------
     # print_char(display_char, digit)
     #
@@ -917,28 +1058,19 @@ class QwiicAlphanumeric(object):
 
         @return **Void** nothing
         """
-        # Convert character to ASCII representation
-        display_char = ord(display_char)
-        character_position = 65532
-
-        # Space
-        if display_char == ord(' '):
-            character_position = 0
-        # Printable symbols -- between first character '!' and last character '~'
-        elif display_char >= ord('!') and display_char <= ord('~'):
-            character_position = display_char - ord('!') + 1
-
         disp_num = int(self.digit_position / 4)
 
-        # Take care of special characters by turning correct segment on 
-        if character_position == 14:    # '.'
-            self.decimal_on_single(disp_num+1)
-        if character_position == 26:    # ':'
-            self.colon_on_single(disp_num+1)
-        if character_position == 65532: # unknown character
-            character_position = self.SFE_ALPHANUM_UNKNOWN_CHAR
+        # Take care of special characters by turning correct segment on. The RAM
+        # bit is only staged here; print() pushes the finished frame in one update.
+        if display_char == '.':
+            self._set_decimal_bit(disp_num+1, True)
+        elif display_char == ':':
+            self._set_colon_bit(disp_num+1, True)
 
-        self.illuminate_char(self.alphanumeric_segs[character_position], digit)
+        # Look up the precomputed RAM bits for this character and digit slot
+        offset = int(digit / 4) * 16
+        for adr, mask in self._char_ram.get(display_char, self._unknown_ram)[digit % 4]:
+            self.display_RAM[offset + adr] |= mask
     
     # ---------------------------------------------------------------------------------
     # print(print_string)
@@ -952,8 +1084,10 @@ class QwiicAlphanumeric(object):
 
         @return **bool** true if update_display() is successful, false otherwise
         """
-        # Clear the display_RAM array
-        self.clear()
+        # Clear the display_RAM array. Nothing is sent yet: update_display() below
+        # compares the new frame with what the displays hold and writes only changes.
+        for i in range(0, 16 * self.number_of_displays):
+            self.display_RAM[i] = 0
         
         self.digit_position = 0
         string_index = 0
@@ -972,26 +1106,304 @@ class QwiicAlphanumeric(object):
                 self.digit_position += 1
             string_index += 1
         
-        self.update_display()
+        return self.update_display()
     
     # ---------------------------------------------------------------------------------
     # update_display()
     #
-    # Push the contents of display_RAM out to the various displays in 16 byte chunks
+    # Push the changed parts of display_RAM out to the various displays
     def update_display(self):
         """!
-        Push the contents of display_RAM out on to the various displays in 16 byte chunks
+        Push the contents of display_RAM out on to the various displays. Each display's
+        16 byte image is compared with a shadow copy of what was last written to it;
+        displays that are unchanged are skipped and otherwise only the span of bytes from
+        the first to the last difference is written. With populated_rows_only set, the
+        unused RAM after byte 12 is never written.
 
         @return **bool** true if displays are updated successfully, false otherwise.
         """
         status = True
 
         for i in range(1, self.number_of_displays + 1):
-            
-            if self.write_RAM(self.look_up_display_address(i), 0, self.display_RAM[(i-1)*16:(i*16)-1]) == False:
+            span = self._changed_span(i)
+            if span is None:
+                continue    # Display already shows this frame
+
+            image = self._display_image(i)
+            if self.write_RAM(self.look_up_display_address(i), span[0], image[span[0]:span[1] + 1]) == False:
                 status = False
+            else:
+                self._commit_shadow(i, image)
         
         return status
+
+    # ---------------------------------------------------------------------------------
+    # _changed_span(display_number)
+    #
+    # Find the part of a display's RAM image that differs from what it shows
+    def _changed_span(self, display_number):
+        """!
+        Compare a display's chunk of display_RAM with the shadow of what it holds
+
+        @param display_number: the number of the display, starting at 1
+
+        @return **tuple** (first, last) changed byte offsets, or None if nothing changed
+        """
+        image = self._display_image(display_number)
+        shadow = self._shadow_RAM[display_number-1]
+        if shadow is None or len(shadow) != len(image):
+            # Unknown, or recorded before populated_rows_only changed
+            return (0, len(image) - 1)
+        if image == shadow:
+            return None
+
+        first = 0
+        last = len(image) - 1
+        while image[first] == shadow[first]:
+            first += 1
+        while image[last] == shadow[last]:
+            last -= 1
+        return (first, last)
+
+    # ---------------------------------------------------------------------------------
+    # _display_image(display_number), _commit_shadow(display_number, image)
+    #
+    # A display's part of display_RAM, and recording it as written
+    def _display_image(self, display_number):
+        start = (display_number - 1) * 16
+        if self.populated_rows_only:
+            return self._RAM_view[start:start + self.ALPHA_RAM_POPULATED_BYTES]
+        return self._RAM_view[start:start + 16]
+
+    def _commit_shadow(self, display_number, image):
+        shadow = self._shadow_RAM[display_number-1]
+        if shadow is not None and len(shadow) == len(image):
+            shadow[:] = image   # Reuse the buffer
+        else:
+            self._shadow_RAM[display_number-1] = bytearray(image)
+
+    # ---------------------------------------------------------------------------------
+    # refresh_display()
+    #
+    # Rewrite every display in full, e.g. after a display lost power
+    def refresh_display(self):
+        """!
+        Forget what the displays are believed to hold and rewrite all of display_RAM
+
+        @return **bool** true if displays are updated successfully, false otherwise.
+        """
+        self._shadow_RAM = [None] * len(self._shadow_RAM)
+        return self.update_display()
+    
+    # ---------------------------------------------------------------------------------
+    # render_frame(text)
+    #
+    # Build the RAM image of a string without touching the displays
+    def render_frame(self, text):
+        """!
+        Build the display RAM image that print() would produce for a string, without
+        changing display_RAM or writing to the displays. '.' and ':' light the decimal
+        or colon of the display holding the next digit, exactly as in print().
+
+        @param text: string to render
+
+        @return **bytes** 16 bytes of RAM per display
+        """
+        ram = bytearray(16 * self.number_of_displays)
+        digit = 0
+
+        for display_char in text:
+            if digit >= 4 * self.number_of_displays:
+                break
+            if display_char == '.':
+                ram[int(digit / 4) * 16 + 0x03] |= 0x01
+            elif display_char == ':':
+                ram[int(digit / 4) * 16 + 0x01] |= 0x01
+            else:
+                offset = int(digit / 4) * 16
+                for adr, mask in self._char_ram.get(display_char, self._unknown_ram)[digit % 4]:
+                    ram[offset + adr] |= mask
+                digit += 1
+        
+        return bytes(ram)
+
+    # ---------------------------------------------------------------------------------
+    # _cells(text)
+    #
+    # Split a string into digit cells, keeping '.' and ':' with the character before them
+    def _cells(self, text):
+        cells = []
+        for display_char in text:
+            if (display_char == '.' or display_char == ':') and len(cells) > 0:
+                cells[-1] += display_char
+            else:
+                cells.append(display_char)
+        return cells
+
+    # ---------------------------------------------------------------------------------
+    # render_scroll(text)
+    #
+    # Precompute the frames of a string scrolling across the displays once
+    def render_scroll(self, text):
+        """!
+        Precompute the frames of a string scrolling right to left across the displays:
+        it enters from the right edge and leaves off the left edge, one digit per frame.
+
+        @param text: string to scroll, any length
+
+        @return **list** of RAM images, ready for play_frames()
+        """
+        width = 4 * self.number_of_displays
+        cells = [' '] * width + self._cells(text) + [' '] * width
+        return [self.render_frame(''.join(cells[i:i + width])) for i in range(len(cells) - width + 1)]
+
+    # ---------------------------------------------------------------------------------
+    # render_marquee(text, gap)
+    #
+    # Precompute one cycle of a string wrapping around the displays
+    def render_marquee(self, text, gap = 4):
+        """!
+        Precompute one full cycle of a marquee: the string followed by gap blanks,
+        wrapping around so that the last frame leads back into the first.
+
+        @param text: string to loop
+        @param gap: number of blank digits between repeats
+
+        @return **list** of RAM images, ready for play_frames() with loops
+        """
+        width = 4 * self.number_of_displays
+        cells = self._cells(text) + [' '] * gap
+        ring = cells * (int(width / len(cells)) + 2)
+        return [self.render_frame(''.join(ring[i:i + width])) for i in range(len(cells))]
+
+    # ---------------------------------------------------------------------------------
+    # render_blink(text)
+    #
+    # Precompute the frames of a string blinking on and off
+    def render_blink(self, text):
+        """!
+        Precompute a blink cycle in software: the string, then blank displays.
+        Unlike set_blink_rate(), the rate and number of blinks are set by play_frames().
+
+        @param text: string to blink
+
+        @return **list** of two RAM images
+        """
+        return [self.render_frame(text), bytes(16 * self.number_of_displays)]
+
+    # ---------------------------------------------------------------------------------
+    # play_frames(frames, fps, loops, stop_event)
+    #
+    # Stream precomputed RAM images to the displays at a fixed frame rate
+    def play_frames(self, frames, fps = 8, loops = 1, stop_event = None):
+        """!
+        Stream precomputed RAM images to the displays at a fixed frame rate. Each frame
+        goes through update_display(), so only the bytes that differ from the previous
+        frame are written. Frame times are kept on the monotonic clock; when a write
+        runs late the frames that are already overdue are dropped instead of slowing
+        the whole animation down.
+
+        @param frames: list of RAM images from render_frame(), render_scroll(), etc.
+        @param fps: frames per second
+        @param loops: number of times to play the frames, 0 to repeat until stopped
+        @param stop_event: optional threading.Event that ends playback when set
+
+        @return **bool** true if every frame was written successfully, false otherwise
+        """
+        status = True
+        if len(frames) == 0:
+            return status
+
+        period = 1.0 / fps
+        total = len(frames) * loops
+        start = time.monotonic()
+        k = 0
+
+        while loops == 0 or k < total:
+            frame = frames[k % len(frames)]
+            self.display_RAM[0:len(frame)] = frame
+            if self.update_display() == False:
+                status = False
+            k += 1
+
+            now = time.monotonic()
+            due = start + k * period
+            if now >= due:
+                k = max(k, int((now - start) / period))    # Skip overdue frames
+                continue
+            if stop_event is not None:
+                if stop_event.wait(due - now):
+                    break
+            else:
+                time.sleep(due - now)
+            if stop_event is not None and stop_event.is_set():
+                break
+
+        return status
+
+    # ---------------------------------------------------------------------------------
+    # scroll(text, fps, loops)
+    #
+    # Scroll a string of any length across the displays
+    def scroll(self, text, fps = 8, loops = 1, stop_event = None):
+        """!
+        Scroll a string of any length across the displays, right to left
+
+        @param text: string to scroll
+        @param fps: digits moved per second
+        @param loops: number of passes, 0 to repeat until stopped
+        @param stop_event: optional threading.Event that ends scrolling when set
+
+        @return **bool** true if displays update successfully, false otherwise.
+        """
+        return self.play_frames(self.render_scroll(text), fps, loops, stop_event)
+
+    # ---------------------------------------------------------------------------------
+    # marquee(text, fps, loops, gap)
+    #
+    # Loop a string around the displays
+    def marquee(self, text, fps = 8, loops = 0, stop_event = None, gap = 4):
+        """!
+        Loop a string around the displays, the start following the end after gap blanks
+
+        @param text: string to loop
+        @param fps: digits moved per second
+        @param loops: number of full cycles, 0 to repeat until stopped
+        @param stop_event: optional threading.Event that ends the marquee when set
+        @param gap: number of blank digits between repeats
+
+        @return **bool** true if displays update successfully, false otherwise.
+        """
+        return self.play_frames(self.render_marquee(text, gap), fps, loops, stop_event)
+
+    # ---------------------------------------------------------------------------------
+    # blink_text(text, times, rate)
+    #
+    # Blink a string on and off a number of times
+    def blink_text(self, text, times = 3, rate = 2, stop_event = None):
+        """!
+        Blink a string on and off, leaving it displayed afterwards
+
+        @param text: string to blink
+        @param times: number of blinks, 0 to blink until stopped
+        @param rate: blinks per second
+        @param stop_event: optional threading.Event that ends blinking when set
+
+        @return **bool** true if displays update successfully, false otherwise.
+        """
+        frames = self.render_blink(text)
+        status = self.play_frames(frames, rate * 2, times, stop_event)
+        return self.play_frames(frames[:1]) and status
+
+    # ---------------------------------------------------------------------------------
+    # _show_content()
+    #
+    # Render display_content straight into display_RAM and push it
+    def _show_content(self):
+        text = ''.join([c for c in self.display_content[0:4 * self.number_of_displays] if c != '\x00'])
+        frame = self.render_frame(text)
+        self.display_RAM[0:len(frame)] = frame
+        return self.update_display()
     
     # ---------------------------------------------------------------------------------
     # shift_right(shift_amt)
@@ -1005,23 +1417,11 @@ class QwiicAlphanumeric(object):
 
         @return **bool** true if display updates successfully, false otherwise.
         """
-        for x in range((4 * self.number_of_displays) - shift_amt, shift_amt-1, -1):
-            self.display_content[x] = self.display_content[x - shift_amt]
-        
-        # Clear the leading characters
-        for x in range(0, shift_amt):
-            if x + shift_amt > (4 * self.number_of_displays):
-                break   # Error check
+        width = 4 * self.number_of_displays
+        shift_amt = min(shift_amt, width)
+        self.display_content[0:width] = [' '] * shift_amt + self.display_content[0:width - shift_amt]
 
-            self.display_content[0 + x] = ' '     
-        
-        # Convert list of characters into string
-        temp = ""
-        for x in range(0, len(self.display_content)):
-            if self.display_content[x] != '\x00':
-                temp += self.display_content[x]
-
-        self.print(temp)
+        return self._show_content()
 
     # ---------------------------------------------------------------------------------
     # shift_left(shift_amt)
@@ -1035,25 +1435,86 @@ class QwiicAlphanumeric(object):
 
         @return **bool** true if display updates successfully, false otherwise.
         """
-        for x in range(0, 4 * self.number_of_displays):
-            if (x + shift_amt) > (4 * self.number_of_displays):
-                break   # Error check
-            self.display_content[x] = self.display_content[x + shift_amt]
-        
-        # Clear the trailing characters
-        for x in range(0, shift_amt):
-            if (4 * self.number_of_displays - 1 - x) < 0:
-                break   # Error check
-            
-            self.display_content[4 * self.number_of_displays - 1 - x] = ' ' 
-        
-        # Convert list of characters into string
-        temp = ''
-        for x in range(0, len(self.display_content)):
-            if self.display_content[x] != '\x00':
-                temp += self.display_content[x]
-        
-        self.print(temp)
+        width = 4 * self.number_of_displays
+        shift_amt = min(shift_amt, width)
+        self.display_content[0:width] = self.display_content[shift_amt:width] + [' '] * shift_amt
+
+        return self._show_content()
+
+    # ---------------------------------------------------------------------------------
+    # set_reconnect_callback(callback)
+    #
+    # Register a function to run when a display that stopped responding comes back
+    def set_reconnect_callback(self, callback):
+        """!
+        Register a function to run when a display that stopped responding comes back.
+        By then the display has already been re-initialized and its RAM will be
+        rewritten in full on the next update.
+
+        @param callback: function taking the display number, or None to remove it
+
+        @return **Void** nothing
+        """
+        self._reconnect_callback = callback
+
+    # ---------------------------------------------------------------------------------
+    # _mark_offline(address)
+    #
+    # Record a failed write and schedule the next reconnect attempt with backoff
+    def _mark_offline(self, address):
+        failures = self._offline[address][0] + 1 if address in self._offline else 1
+        backoff = min(self.RECONNECT_BACKOFF_MIN * (2 ** (failures - 1)), self.RECONNECT_BACKOFF_MAX)
+        self._offline[address] = (failures, time.monotonic() + backoff)
+
+    # ---------------------------------------------------------------------------------
+    # _try_reconnect(address)
+    #
+    # Probe an offline display if its backoff has expired and restore it if it answers
+    def _try_reconnect(self, address):
+        failures, retry_at = self._offline[address]
+        if time.monotonic() < retry_at:
+            return False
+
+        try:
+            connected = self._probe(address)
+        except Exception:
+            connected = False
+        if not connected:
+            self._mark_offline(address)
+            return False
+
+        # The display may have lost power: restore its settings, forget its RAM contents
+        try:
+            sent = self._sent.get(address, {})
+            self._write_command(address, sent.get(self.ALPHA_CMD_SYSTEM_SETUP, self.ALPHA_CMD_SYSTEM_SETUP | 1))
+            time.sleep(0.001)   # Allow display to start
+            self._write_command(address, sent.get(self.ALPHA_CMD_DIMMING_SETUP, self.ALPHA_CMD_DIMMING_SETUP | 15))
+            self._write_command(address, sent.get(self.ALPHA_CMD_DISPLAY_SETUP,
+                                                  self.ALPHA_CMD_DISPLAY_SETUP | (self.blink_rate << 1) | self.display_on_off))
+        except Exception:
+            self._mark_offline(address)
+            return False
+
+        del self._offline[address]
+        for i in range(1, self.number_of_displays + 1):
+            if self.look_up_display_address(i) == address:
+                self._shadow_RAM[i-1] = None
+                if self._reconnect_callback is not None:
+                    self._reconnect_callback(i)
+        return True
+
+    # ---------------------------------------------------------------------------------
+    # _probe(address), _write_block(address, reg, buff), _write_command(address, command)
+    #
+    # The raw bus operations, kept apart so display groups can route them
+    def _probe(self, address):
+        return self._i2c.isDeviceConnected(address)
+
+    def _write_block(self, address, reg, buff):
+        self._i2c.writeBlock(address, reg, buff)
+
+    def _write_command(self, address, command):
+        self._i2c.writeCommand(address, command)
 
     # ---------------------------------------------------------------------------------
     # write_RAM(address, reg, buff)
@@ -1061,7 +1522,9 @@ class QwiicAlphanumeric(object):
     # write LED updates to the RAM of the LED driver IC
     def write_RAM(self, address, reg, buff):
         """!
-        Write LED updates to the RAM of the LED driver IC
+        Write LED updates to the RAM of the LED driver IC.
+        The display is not probed first; a failed write marks it offline and later
+        writes retry it with exponential backoff (see set_reconnect_callback()).
 
         @param address: I2C address of the display
         @param reg: the location in RAM to write to
@@ -1069,17 +1532,420 @@ class QwiicAlphanumeric(object):
 
         @return **bool** true if RAM has been written to successfully, false otherwise.
         """
-        display_num = 1 
-        if address == self._device_address_display_two:
-            display_num = 2
-        elif address == self._device_address_display_three:
-            display_num = 3
-        elif address == self._device_address_display_four:
-            display_num = 4
-
-        self.is_connected(display_num)
+        if self._offline and address in self._offline and not self._try_reconnect(address):
+            return False
 
-        self._i2c.writeBlock(address, reg, buff)
+        try:
+            self._write_block(address, reg, buff)
+        except Exception:
+            self._mark_offline(address)
+            return False
+        return True
     
+    # ---------------------------------------------------------------------------------
+    # write_RAM_byte(address, data_to_write)
+    #
+    # Send a single command byte to the LED driver IC
     def write_RAM_byte(self, address, data_to_write):
-        self._i2c.writeCommand(address, data_to_write)
+        """!
+        Send a single command byte to the LED driver IC
+
+        @param address: I2C address of the display
+        @param data_to_write: the command byte
+
+        @return **bool** true if the command was written successfully, false otherwise.
+        """
+        if self._offline and address in self._offline and not self._try_reconnect(address):
+            return False
+
+        try:
+            self._write_command(address, data_to_write)
+        except Exception:
+            self._mark_offline(address)
+            return False
+        self._sent.setdefault(address, {})[data_to_write & 0xF0] = data_to_write
+        return True
+
+class QwiicAlphanumericGroup(QwiicAlphanumeric):
+    """!
+    QwiicAlphanumericGroup
+
+    Any number of Qwiic Alphanumeric displays, spread over several I2C buses and
+    Qwiic Mux (TCA9548A) channels, driven as one row of text. Everything that works
+    on a QwiicAlphanumeric (print, scroll, brightness, ...) works on the whole row.
+
+    @param displays: list of (bus, mux_channel, address) tuples, left to right.
+                    bus is an I2C bus number or an existing i2c driver object.
+                    mux_channel is None for a display wired straight to the bus.
+    @param mux_address: I2C address of the mux on each bus. A mux comes set to 0x70
+                    like the first display, so its address jumpers must be moved.
+    """
+    __slots__ = ('displays', 'mux_address', '_drivers', '_mux_channel', '_muxed_buses', '_bus_locks', '_executor')
+
+    DEFAULT_MUX_ADDRESS = 0x77
+    MUX_NO_CHANNEL = -1     # _mux_channel value once every mux channel is switched off
+
+    def __init__(self, displays, mux_address = DEFAULT_MUX_ADDRESS):
+
+        self.displays = [tuple(display) for display in displays]
+        self.mux_address = mux_address
+        self._drivers = {}      # bus -> i2c driver
+        self._mux_channel = {}  # bus -> mux channel currently selected, None if unknown
+        self._muxed_buses = set([display[0] for display in self.displays if display[1] is not None])
+        self._bus_locks = {}
+        self._executor = None
+
+        for bus, channel, address in self.displays:
+            if bus not in self._drivers:
+                if isinstance(bus, int):
+                    self._drivers[bus] = qwiic_i2c.getI2CDriver(iBus = bus)
+                else:
+                    self._drivers[bus] = bus
+                self._mux_channel[bus] = None
+                self._bus_locks[bus] = threading.Lock()
+
+        first_bus, first_channel, first_address = self.displays[0]
+        QwiicAlphanumeric.__init__(self, first_address, self._drivers[first_bus])
+
+        self.number_of_displays = len(self.displays)
+        self.display_RAM = bytearray(16 * self.number_of_displays)
+        self._RAM_view = memoryview(self.display_RAM)
+        self.display_content = [' '] * (4 * self.number_of_displays + 1)
+        self._shadow_RAM = [None] * self.number_of_displays
+
+    # ---------------------------------------------------------------------------------
+    # begin()
+    #
+    # Check every display answers, then initialize and clear them
+    def begin(self):
+        """!
+        Initialize the operation of every display in the group
+
+        @return **bool** Returns true if all displays are connected and initialized.
+                False otherwise.
+        """
+        for i in range(1, self.number_of_displays + 1):
+            if self.is_connected(i) == False:
+                return False
+
+        self._shadow_RAM = [None] * self.number_of_displays
+        self._offline = {}
+
+        if self.initialize() == False:
+            return False
+
+        if self.clear() == False:
+            return False
+
+        self.display_content[4 * self.number_of_displays] = '\0'
+
+        return True
+
+    # ---------------------------------------------------------------------------------
+    # look_up_display_address(display_number)
+    #
+    # Displays in a group are identified by their (bus, mux_channel, address) entry
+    def look_up_display_address(self, display_number):
+        """!
+        Look up the entry of a display. Addresses repeat across buses and mux channels,
+        so the whole (bus, mux_channel, address) tuple stands in for the I2C address.
+
+        @param display_number: the number of the display, starting at 1
+
+        @return **tuple** (bus, mux_channel, address), or 0 if display_number is not valid
+        """
+        if 1 <= display_number <= self.number_of_displays:
+            return self.displays[display_number - 1]
+        return 0
+
+    # ---------------------------------------------------------------------------------
+    # _route(entry)
+    #
+    # Select the mux channel of a display if needed; the caller holds the bus lock.
+    # A display wired straight to a bus with a mux on it gets every channel switched
+    # off first, or a display on the selected channel at the same address would
+    # take its writes too.
+    def _route(self, entry):
+        bus, channel, address = entry
+        driver = self._drivers[bus]
+        if channel is None:
+            if bus in self._muxed_buses and self._mux_channel[bus] != self.MUX_NO_CHANNEL:
+                self._mux_channel[bus] = None
+                driver.writeCommand(self.mux_address, 0)
+                self._mux_channel[bus] = self.MUX_NO_CHANNEL
+        elif self._mux_channel[bus] != channel:
+            self._mux_channel[bus] = None
+            driver.writeCommand(self.mux_address, 1 << channel)
+            self._mux_channel[bus] = channel
+        return driver, address
+
+    def _probe(self, entry):
+        with self._bus_locks[entry[0]]:
+            try:
+                driver, address = self._route(entry)
+                return driver.isDeviceConnected(address)
+            except Exception:
+                return False
+
+    def _write_block(self, entry, reg, buff):
+        with self._bus_locks[entry[0]]:
+            try:
+                driver, address = self._route(entry)
+                driver.writeBlock(address, reg, buff)
+            except Exception:
+                self._mux_channel[entry[0]] = None  # The mux may not have seen the select
+                raise
+
+    def _write_command(self, entry, command):
+        with self._bus_locks[entry[0]]:
+            try:
+                driver, address = self._route(entry)
+                driver.writeCommand(address, command)
+            except Exception:
+                self._mux_channel[entry[0]] = None
+                raise
+
+    # ---------------------------------------------------------------------------------
+    # update_display()
+    #
+    # Push the changed parts of display_RAM out, one batch per bus, buses in parallel
+    def update_display(self):
+        """!
+        Push the changed parts of display_RAM out to the displays. Changes are batched
+        per bus and each batch is written in mux channel order, so every channel is
+        selected at most once per frame. With more than one bus the batches are written
+        in parallel.
+
+        @return **bool** true if displays are updated successfully, false otherwise.
+        """
+        jobs = []
+        for i in range(1, self.number_of_displays + 1):
+            span = self._changed_span(i)
+            if span is not None:
+                jobs.append((self.displays[i-1], (i, span)))
+        return self._run_per_bus(jobs, self._write_span)
+
+    def _write_span(self, entry, job):
+        i, (first, last) = job
+        image = self._display_image(i)
+        if self.write_RAM(entry, first, image[first:last + 1]) == False:
+            return False
+        self._commit_shadow(i, image)
+        return True
+
+    def _send_commands(self, commands):
+        return self._run_per_bus(commands, self.write_RAM_byte)
+
+    # ---------------------------------------------------------------------------------
+    # _run_per_bus(jobs, write)
+    #
+    # Run (entry, payload) writes in per-bus batches, buses in parallel
+    def _run_per_bus(self, jobs, write):
+        """!
+        Run writes grouped by bus. Within a bus, the displays the mux already routes to
+        go first (the selected channel, or the directly wired displays if every channel
+        is off), then the directly wired displays, then the other channels in order.
+        Separate buses are written in parallel.
+
+        @param jobs: list of (display entry, payload) pairs
+        @param write: function taking (entry, payload) and returning a bool
+
+        @return **bool** true if every write succeeded, false otherwise.
+        """
+        batches = {}
+        for job in jobs:
+            batches.setdefault(job[0][0], []).append(job)
+
+        def run(batch):
+            current = self._mux_channel[batch[0][0][0]]
+            if current is None:
+                current = self.MUX_NO_CHANNEL   # Unknown: every write selects anyway
+
+            def order(job):
+                channel = job[0][1]
+                if channel is None:
+                    return (0 if current == self.MUX_NO_CHANNEL else 1, -1)
+                return (0 if channel == current else 2, channel)
+
+            batch.sort(key = order)
+            status = True
+            for entry, payload in batch:
+                if write(entry, payload) == False:
+                    status = False
+            return status
+
+        if len(batches) == 0:
+            return True
+        if len(batches) == 1:
+            return run(list(batches.values())[0])
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers = len(self._drivers), thread_name_prefix = "alphanumeric-bus")
+        return all(list(self._executor.map(run, batches.values())))
+
+    # ---------------------------------------------------------------------------------
+    # close()
+    #
+    # Stop the bus writer threads
+    def close(self):
+        """!
+        Stop the threads used to update buses in parallel
+
+        @return **Void** nothing
+        """
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+class QwiicAlphanumericWriter(object):
+    """!
+    QwiicAlphanumericWriter
+
+    Drive a display from a background thread, so callers never wait on the I2C bus.
+    Callers post what they want shown and return at once. Only the newest post is
+    kept: anything posted while the thread is busy or rate limited replaces what was
+    waiting, and the thread writes at most max_fps updates a second.
+
+    @param display: a QwiicAlphanumeric or QwiicAlphanumericGroup, already begun
+    @param max_fps: the most display updates to write per second
+    """
+    def __init__(self, display, max_fps = 10):
+        self.display = display
+        self.max_fps = max_fps
+        self.dropped = 0    # Posts replaced before they were written
+        self.failed = 0     # Updates the display did not accept
+
+        self._condition = threading.Condition()
+        self._pending = None    # ('text', string) or ('frame', RAM image)
+        self._settings = {}     # apply_settings() keywords still to send
+        self._stopping = False
+        self._thread = None
+
+    # ---------------------------------------------------------------------------------
+    # start()
+    #
+    # Start the writer thread
+    def start(self):
+        """!
+        Start the writer thread
+
+        @return **Void** nothing
+        """
+        self._stopping = False
+        self._thread = threading.Thread(target = self._run, name = "alphanumeric-writer", daemon = True)
+        self._thread.start()
+
+    # ---------------------------------------------------------------------------------
+    # stop(flush)
+    #
+    # Stop the writer thread
+    def stop(self, flush = True):
+        """!
+        Stop the writer thread
+
+        @param flush: write whatever is still waiting before stopping
+
+        @return **Void** nothing
+        """
+        with self._condition:
+            if not flush:
+                self._pending = None
+                self._settings = {}
+            self._stopping = True
+            self._condition.notify()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    # ---------------------------------------------------------------------------------
+    # show(text)
+    #
+    # Post a string to be printed
+    def show(self, text):
+        """!
+        Post a string to be printed. Returns immediately.
+
+        @param text: string for QwiicAlphanumeric.print()
+
+        @return **Void** nothing
+        """
+        self._post(('text', text))
+
+    # ---------------------------------------------------------------------------------
+    # show_frame(frame)
+    #
+    # Post a precomputed RAM image to be shown
+    def show_frame(self, frame):
+        """!
+        Post a RAM image from render_frame() to be shown. Returns immediately.
+
+        @param frame: RAM image, 16 bytes per display
+
+        @return **Void** nothing
+        """
+        self._post(('frame', bytes(frame)))
+
+    # ---------------------------------------------------------------------------------
+    # apply_settings(**settings)
+    #
+    # Post brightness, blink or on/off changes
+    def apply_settings(self, **settings):
+        """!
+        Post setting changes for QwiicAlphanumeric.apply_settings(). Returns immediately.
+        Later posts of the same setting replace earlier ones that were not sent yet.
+
+        @param settings: keywords accepted by QwiicAlphanumeric.apply_settings()
+
+        @return **Void** nothing
+        """
+        with self._condition:
+            self._settings.update(settings)
+            self._condition.notify()
+
+    def _post(self, item):
+        with self._condition:
+            if self._pending is not None:
+                self.dropped += 1
+            self._pending = item
+            self._condition.notify()
+
+    # ---------------------------------------------------------------------------------
+    # _run()
+    #
+    # Writer thread: take the newest post, write it, wait out the frame period
+    def _run(self):
+        period = 1.0 / self.max_fps
+        next_write = 0.0
+
+        while True:
+            with self._condition:
+                while self._pending is None and len(self._settings) == 0 and not self._stopping:
+                    self._condition.wait()
+                if self._pending is None and len(self._settings) == 0:
+                    return  # Stopping with nothing left to write
+
+                delay = next_write - time.monotonic()
+                if delay > 0 and not self._stopping:
+                    self._condition.wait(delay)
+                    continue    # Posts made meanwhile replace the pending one
+
+                item = self._pending
+                settings = self._settings
+                self._pending = None
+                self._settings = {}
+
+            next_write = time.monotonic() + period
+            try:
+                status = True
+                if len(settings) > 0:
+                    status = self.display.apply_settings(**settings)
+                if item is not None:
+                    if item[0] == 'text':
+                        status = self.display.print(item[1]) and status
+                    else:
+                        self.display.display_RAM[0:len(item[1])] = item[1]
+                        status = self.display.update_display() and status
+            except Exception:
+                status = False
+            if status == False:
+                self.failed += 1
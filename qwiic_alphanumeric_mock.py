@@ -0,0 +1,263 @@
+#-----------------------------------------------------------------------------
+# qwiic_alphanumeric_mock.py
+#
+# In-memory stand-in for an I2C bus of HT16K33 displays, for exercising and
+# benchmarking qwiic_alphanumeric without hardware.
+#-----------------------------------------------------------------------------
+
+"""!
+qwiic_alphanumeric_mock
+=======================
+An in-memory I2C bus of HT16K33 LED drivers with the qwiic_i2c driver methods
+that qwiic_alphanumeric uses. Each chip keeps its 16 byte display RAM and its
+oscillator, display, blink and dimming settings as the real part would, and the
+bus counts transactions and bytes so driver changes can be measured.
+
+    bus = MockI2CBus()
+    display = qwiic_alphanumeric.QwiicAlphanumeric(i2c_driver = bus)
+    display.begin()
+    display.print("Milk")
+    bus.text(0x70)  # 'Milk'
+"""
+# ---------------------------------------------------------------------------------
+
+import time
+
+from qwiic_alphanumeric import QwiicAlphanumeric, _segment_ram_bit
+
+# Bits on the wire per transaction: start, address byte + ACK, stop
+_TRANSACTION_OVERHEAD_BITS = 1 + 9 + 1
+_BITS_PER_BYTE = 9  # 8 data bits + ACK
+
+# Segment mask -> character, for reading text back out of display RAM
+_SEGS_TO_CHAR = {}
+for _i, _segs in enumerate(QwiicAlphanumeric.alphanumeric_segs[:QwiicAlphanumeric.SFE_ALPHANUM_UNKNOWN_CHAR]):
+    _SEGS_TO_CHAR.setdefault(_segs, ' ' if _i == 0 else chr(ord('!') + _i - 1))
+del _i, _segs
+
+# ---------------------------------------------------------------------------------
+# MockHT16K33
+#
+# State of one LED driver chip
+class MockHT16K33(object):
+    """!
+    MockHT16K33
+
+    One HT16K33: display RAM, address pointer and the setup registers.
+    """
+    def __init__(self):
+        self.power_on()
+
+    def power_on(self):
+        """!
+        Reset to the power-on state: oscillator and display off, RAM cleared
+
+        @return **Void** nothing
+        """
+        self.ram = bytearray(16)
+        self.pointer = 0
+        self.oscillator = False
+        self.display_on = False
+        self.blink = 0
+        self.dimming = 15
+
+    def command(self, byte):
+        """!
+        Apply a single command byte
+
+        @param byte: the command
+
+        @return **Void** nothing
+        """
+        kind = byte & 0xF0
+        if kind == 0x00:
+            self.pointer = byte & 0x0F
+        elif kind == QwiicAlphanumeric.ALPHA_CMD_SYSTEM_SETUP:
+            self.oscillator = bool(byte & 0x01)
+        elif kind == QwiicAlphanumeric.ALPHA_CMD_DISPLAY_SETUP:
+            self.display_on = bool(byte & 0x01)
+            self.blink = (byte >> 1) & 0b11
+        elif kind == QwiicAlphanumeric.ALPHA_CMD_DIMMING_SETUP:
+            self.dimming = byte & 0x0F
+
+    def write(self, data):
+        """!
+        Write display data at the address pointer. Like the chip, the pointer
+        wraps from 0x0F back to 0x00.
+
+        @param data: bytes to write
+
+        @return **Void** nothing
+        """
+        for byte in data:
+            self.ram[self.pointer] = byte
+            self.pointer = (self.pointer + 1) & 0x0F
+
+    def segments(self):
+        """!
+        Segment mask lit in each of the four digits
+
+        @return **list** four 14 bit masks, 'A' in bit 0
+        """
+        masks = [0, 0, 0, 0]
+        for slot in range(0, 4):
+            for segment in range(0, 14):
+                adr, bit = _segment_ram_bit(segment, slot)
+                if self.ram[adr] & bit:
+                    masks[slot] |= 1 << segment
+        return masks
+
+    def text(self):
+        """!
+        The characters shown, with '?' for patterns that are not a character. A lit
+        colon and decimal point are appended as ':' and '.'.
+
+        @return **str** text on the display
+        """
+        text = ''.join([_SEGS_TO_CHAR.get(mask, '?') for mask in self.segments()])
+        if self.ram[0x01] & 0x01:
+            text += ':'
+        if self.ram[0x03] & 0x01:
+            text += '.'
+        return text
+
+# ---------------------------------------------------------------------------------
+# MockI2CBus
+#
+# qwiic_i2c style driver backed by MockHT16K33 chips
+class MockI2CBus(object):
+    """!
+    MockI2CBus
+
+    A qwiic_i2c style driver with MockHT16K33 chips on it. With mux_address set the
+    bus also has a Qwiic Mux (TCA9548A), and displays are looked up by the selected
+    channel as well as their address. A display wired straight to a bus with a mux
+    has channel None; like the real bus, it sees every transaction to its address,
+    including those meant for a display on the selected channel.
+
+    @param addresses: addresses of the displays on the bus, or with a mux,
+                    (channel, address) pairs
+    @param mux_address: address of a mux on the bus, or None
+    @param clock_hz: bus clock used to work out time on the wire
+    @param simulate_time: sleep for the time each transaction would take on the wire
+    """
+    def __init__(self, addresses = (0x70, 0x71, 0x72, 0x73), mux_address = None, clock_hz = 400000, simulate_time = False):
+        self.mux_address = mux_address
+        self.clock_hz = clock_hz
+        self.simulate_time = simulate_time
+        self.channel = None
+        self.chips = {}
+        for address in addresses:
+            self.chips[address] = MockHT16K33()
+        self.disconnected = set()
+        self.reset_counters()
+
+    # ---------------------------------------------------------------------------------
+    # reset_counters()
+    #
+    # Zero the transaction, byte and wire time counters
+    def reset_counters(self):
+        """!
+        Zero the transaction, byte and wire time counters
+
+        @return **Void** nothing
+        """
+        self.transactions = 0
+        self.bytes = 0          # Bytes after the address byte of each transaction
+        self.mux_selects = 0
+        self.wire_time_s = 0.0  # Time the transactions would take at clock_hz
+
+    def _transfer(self, length):
+        bits = _TRANSACTION_OVERHEAD_BITS + length * _BITS_PER_BYTE
+        self.transactions += 1
+        self.bytes += length
+        self.wire_time_s += bits / self.clock_hz
+        if self.simulate_time:
+            time.sleep(bits / self.clock_hz)
+
+    def _chips(self, address):
+        if self.mux_address is None:
+            keys = [address]
+        else:
+            keys = [(None, address)]
+            if self.channel is not None:
+                keys.append((self.channel, address))
+        chips = [self.chips[key] for key in keys if key in self.chips and key not in self.disconnected]
+        if len(chips) == 0:
+            raise OSError(121, "Remote I/O error")  # What smbus raises on a NAK
+        return chips
+
+    # ---------------------------------------------------------------------------------
+    # chip(address, channel)
+    #
+    # Look up one chip
+    def chip(self, address, channel = None):
+        """!
+        Look up one chip
+
+        @param address: I2C address of the display
+        @param channel: mux channel of the display, if the bus has a mux
+
+        @return **MockHT16K33** the chip
+        """
+        return self.chips[address if self.mux_address is None else (channel, address)]
+
+    # ---------------------------------------------------------------------------------
+    # text(address, channel)
+    #
+    # Read back what a display shows
+    def text(self, address, channel = None):
+        """!
+        Read back what a display shows, see MockHT16K33.text()
+
+        @param address: I2C address of the display
+        @param channel: mux channel of the display, if the bus has a mux
+
+        @return **str** text on the display
+        """
+        return self.chip(address, channel).text()
+
+    # ---------------------------------------------------------------------------------
+    # disconnect(address, channel), reconnect(address, channel)
+    #
+    # Make a display stop answering, and bring it back powered up from scratch
+    def disconnect(self, address, channel = None):
+        self.disconnected.add(address if self.mux_address is None else (channel, address))
+
+    def reconnect(self, address, channel = None):
+        key = address if self.mux_address is None else (channel, address)
+        self.disconnected.discard(key)
+        self.chips[key].power_on()
+
+    # ---------------------------------------------------------------------------------
+    # qwiic_i2c driver methods
+    def isDeviceConnected(self, devAddress):
+        self._transfer(0)
+        if devAddress == self.mux_address:
+            return True
+        try:
+            self._chips(devAddress)
+        except OSError:
+            return False
+        return True
+
+    def writeCommand(self, address, commandCode):
+        self._transfer(1)
+        if address == self.mux_address:
+            self.mux_selects += 1
+            self.channel = (commandCode & -commandCode).bit_length() - 1 if commandCode else None
+            return
+        for chip in self._chips(address):
+            chip.command(commandCode)
+
+    def writeByte(self, address, commandCode, value):
+        self._transfer(2)
+        for chip in self._chips(address):
+            chip.command(commandCode)
+            chip.write([value])
+
+    def writeBlock(self, address, commandCode, value):
+        self._transfer(1 + len(value))
+        for chip in self._chips(address):
+            chip.command(commandCode)
+            chip.write(value)
@@ -0,0 +1,88 @@
+"""Regression checks for qwiic_alphanumeric against the in-memory HT16K33 bus."""
+
+import pytest
+
+import qwiic_alphanumeric
+from qwiic_alphanumeric_mock import MockI2CBus
+
+ADDRESSES = (0x70, 0x71, 0x72, 0x73)
+
+
+def make_display(addresses=ADDRESSES[:1], populated_rows_only=False):
+    bus = MockI2CBus(addresses)
+    display = qwiic_alphanumeric.QwiicAlphanumeric(i2c_driver=bus)
+    display.populated_rows_only = populated_rows_only
+    assert display.begin(*addresses)
+    bus.reset_counters()
+    return display, bus
+
+
+def test_print_renders_known_ram():
+    display, bus = make_display()
+    assert display.print("Milk")
+    assert bytes(bus.chip(0x70).ram) == bytes.fromhex("00001100c10090008100e10000000000")
+    assert bus.text(0x70) == "Milk"
+
+
+def test_print_across_displays():
+    display, bus = make_display(ADDRESSES)
+    assert display.print("ABDEFGHIJKLMNPRS")
+    assert [bus.text(a) for a in ADDRESSES] == ["ABDE", "FGHI", "JKLM", "NPRS"]
+
+
+def test_reprinting_same_text_sends_nothing():
+    display, bus = make_display(ADDRESSES)
+    display.print("HELLO WORLD")
+    bus.reset_counters()
+    assert display.print("HELLO WORLD")
+    assert bus.transactions == 0
+    assert bus.bytes == 0
+
+
+def test_changed_digit_writes_only_its_span():
+    display, bus = make_display()
+    display.print("1234")
+    bus.reset_counters()
+    display.print("1235")
+    assert bus.transactions == 1
+    assert bus.bytes < 1 + 16
+    assert bus.text(0x70) == "1235"
+
+
+@pytest.mark.parametrize("populated_rows_only, image_bytes", [(False, 16), (True, 13)])
+def test_refresh_byte_counts(populated_rows_only, image_bytes):
+    display, bus = make_display(ADDRESSES, populated_rows_only)
+    display.print("ABDEFGHIJKLMNPRS")
+    bus.reset_counters()
+    assert display.refresh_display()
+    # One write per display: the RAM address byte, then the image.
+    assert bus.transactions == len(ADDRESSES)
+    assert bus.bytes == len(ADDRESSES) * (1 + image_bytes)
+    assert [bus.text(a) for a in ADDRESSES] == ["ABDE", "FGHI", "JKLM", "NPRS"]
+
+
+def test_populated_rows_only_set_after_begin():
+    # begin() leaves 16 byte shadows; the 13 byte blank image compared with
+    # them matches on every byte, which used to run the span search off the end.
+    display, bus = make_display()
+    display.populated_rows_only = True
+    assert display.print("    ")
+    assert bus.transactions == 1
+    assert bus.bytes == 1 + 13
+    assert display.print("MILK")
+    assert bus.text(0x70) == "MILK"
+
+
+def test_group_direct_write_does_not_reach_selected_mux_channel():
+    # 0x70 is wired straight to the bus and also sits behind mux channel 0.
+    bus = MockI2CBus([(None, 0x70), (0, 0x70)], mux_address=0x77)
+    group = qwiic_alphanumeric.QwiicAlphanumericGroup([(bus, None, 0x70), (bus, 0, 0x70)])
+    assert group.begin()
+    assert group.print("MILKSAND")
+    assert bus.text(0x70, 0) == "SAND"
+    # Channel 0 is still selected from writing the muxed display; changing only
+    # the direct one must switch it off before writing.
+    assert bus.channel == 0
+    assert group.print("MILESAND")
+    assert bus.channel is None
+    assert bus.text(0x70, 0) == "SAND"